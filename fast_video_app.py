@@ -7,10 +7,17 @@ Uses chunked audio + parallel transcription + hierarchical summarization.
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import font as tkfont
 import threading
 import queue
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
 import sys
 import os
+import io
+import gc
+import math
 from pathlib import Path
 from datetime import datetime
 import time
@@ -19,6 +26,361 @@ import time
 sys.path.insert(0, str(Path(__file__).parent))
 
 
+# ===== Pipeline worker process =====
+# Transcription and summarization run in a spawned process so their Python
+# work never holds the GIL the Tk mainloop needs. Loaded models live in that
+# process and are reused across runs.
+
+_worker_messages = None   # multiprocessing.Queue of (type, data) UI messages
+_worker_stop = None       # multiprocessing.Event set when the user hits Stop
+_transcriber_cache = {}   # (transcriber_type, ...) -> loaded transcriber
+_summarizer = None
+
+
+def _init_worker(messages, stop_event):
+    """Executor initializer: keep the UI queue and stop flag (runs in the worker process)."""
+    global _worker_messages, _worker_stop
+    _worker_messages = messages
+    _worker_stop = stop_event
+    
+    # Pin OpenMP/MKL threads before any model library loads
+    from src.fast_transcriber import configure_cpu_threads
+    configure_cpu_threads()
+
+
+def _post(msg):
+    """Send a (type, data) message to the UI process."""
+    _worker_messages.put(msg)
+
+
+def _get_transcriber(transcriber_type: str, model_size: str, quality: str,
+                     progress_callback=None):
+    """
+    Return a loaded transcriber, reusing the cached one when settings match.
+    
+    Only one transcriber is kept resident; switching model, quality or
+    transcriber releases the previous one before loading the new one.
+    """
+    if transcriber_type == "oriserve-hindi":
+        key = (transcriber_type,)
+    else:
+        key = (transcriber_type, model_size, quality)
+    
+    transcriber = _transcriber_cache.get(key)
+    
+    if transcriber is None:
+        _release_transcribers()
+        
+        if transcriber_type == "oriserve-hindi":
+            from src.oriserve_transcriber import OriserveTranscriber
+            transcriber = OriserveTranscriber()
+        else:
+            from src.fast_transcriber import FastTranscriber
+            transcriber = FastTranscriber(
+                model_size=model_size,
+                compute_type=FastTranscriber.QUALITY_PRESETS.get(quality)
+            )
+        
+        transcriber.load_model(progress_callback=progress_callback)
+        _transcriber_cache[key] = transcriber
+    elif progress_callback:
+        progress_callback("Using already loaded model")
+    
+    return transcriber
+
+
+def _release_transcribers():
+    """Release every cached transcriber's model and free it before anything else loads."""
+    for transcriber in _transcriber_cache.values():
+        transcriber.release()
+    _transcriber_cache.clear()
+    _free_memory()
+
+
+def _free_memory():
+    """Collect released models and return cached GPU memory to the driver."""
+    gc.collect()
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def _prewarm_models(transcriber_type: str, model_size: str, quality: str):
+    """Load the default transcriber ahead of the first run (runs in the worker process)."""
+    try:
+        _get_transcriber(transcriber_type, model_size, quality)
+    except Exception:
+        # Missing packages or models are reported when processing starts
+        pass
+
+
+def _run_pipeline(video_path: str, settings: tuple, start_time: float):
+    """Process video with optimized pipeline (runs in the worker process)."""
+    global _summarizer
+    
+    (model_size, batch_size, chunk_duration, summary_words,
+     transcriber_type, quality, skip_silence, keep_models) = settings
+    
+    # Set when the run ends, so a producer blocked on a full chunk queue exits
+    pipeline_done = threading.Event()
+    
+    try:
+        from src.video_processor import VideoProcessor
+        from src.summarizer import Summarizer
+        
+        # Check for stop request helper
+        def check_stop():
+            if _worker_stop.is_set():
+                raise InterruptedError("Processing stopped by user")
+        
+        # Step 1: Probe video (5%)
+        _post(("status", "Step 1/5: Reading video..."))
+        _post(("progress", 2))
+        check_stop()
+        
+        processor = VideoProcessor()
+        
+        if not processor.is_ffmpeg_available():
+            raise RuntimeError(
+                "FFmpeg not found!\n\n"
+                "Please install FFmpeg and add it to your PATH.\n"
+                "Download from: https://ffmpeg.org/download.html"
+            )
+        
+        audio_duration = processor.get_video_duration(video_path)
+        
+        if skip_silence:
+            # Speech chunks are cut at pauses, so they need no overlap
+            chunk_overlap = 0.0
+        else:
+            # Even out chunk lengths so the last chunk isn't a short, mostly padded one
+            if audio_duration > 0:
+                chunk_duration = audio_duration / math.ceil(audio_duration / chunk_duration)
+            chunk_overlap = processor.CHUNK_OVERLAP
+            
+            # Fit each chunk plus its overlap into whole encoder windows: a 30s
+            # chunk with 1s of overlap would otherwise cost a second window
+            # holding 1s of audio and 29s of padding
+            spill = (chunk_duration + chunk_overlap) % processor.WINDOW_SECONDS
+            if 0 < spill <= chunk_overlap:
+                chunk_duration -= spill
+        
+        _post(("progress", 5))
+        check_stop()
+        
+        # Step 2: Decode audio into in-memory chunks (10%)
+        _post(("status", f"Step 2/5: Decoding audio ({chunk_duration:.1f}s chunks)..."))
+        
+        # Decode in the background: the model loads and transcription
+        # starts while later chunks are still being decoded. The queue is
+        # bounded so a fast decoder can't run far ahead of transcription.
+        chunk_queue = queue.Queue(maxsize=2 * batch_size)
+        chunk_errors = []
+        
+        def put_chunk(item) -> bool:
+            # Wait for room, but give up once the consumer is gone
+            while not pipeline_done.is_set():
+                try:
+                    chunk_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        
+        def produce_chunks():
+            try:
+                if skip_silence:
+                    chunk_iter = processor.iter_speech_chunks(video_path, chunk_duration=chunk_duration)
+                else:
+                    chunk_iter = processor.iter_audio_chunks(
+                        video_path, chunk_duration=chunk_duration, overlap=chunk_overlap
+                    )
+                for chunk in chunk_iter:
+                    if _worker_stop.is_set() or not put_chunk(chunk):
+                        break
+            except Exception as e:
+                chunk_errors.append(e)
+            finally:
+                put_chunk(None)  # End of chunks
+        
+        def iter_ready_chunks():
+            yield from iter(chunk_queue.get, None)
+            if chunk_errors:
+                raise chunk_errors[0]
+        
+        threading.Thread(target=produce_chunks, daemon=True).start()
+        
+        # Only an estimate when silence is skipped: packing speech into
+        # chunks can yield more or fewer, and progress takes the larger count
+        if audio_duration > 0:
+            total_chunks = max(1, math.ceil(audio_duration / chunk_duration - 1e-6))
+        else:
+            total_chunks = None
+        
+        _post(("progress", 10))
+        check_stop()
+        
+        # Step 3: Load transcriber (15%) - CONDITIONAL BASED ON SELECTION
+        if transcriber_type == "oriserve-hindi":
+            _post(("status", "Step 3/5: Loading Oriserve Hindi/Hinglish model..."))
+        else:
+            from src.fast_transcriber import FastTranscriber
+            _post(("status", f"Step 3/5: Loading Whisper {model_size} model..."))
+        
+        transcriber = _get_transcriber(
+            transcriber_type,
+            model_size,
+            quality,
+            progress_callback=lambda msg: _post(("status", f"Step 3/5: {msg}"))
+        )
+        _post(("progress", 15))
+        check_stop()
+        
+        # Step 4: Transcription (15% → 70%)
+        # Oriserve, or an unknown chunk count, needs the full chunk list up front
+        if transcriber_type == "oriserve-hindi" or total_chunks is None:
+            chunks = list(iter_ready_chunks())
+            total_chunks = len(chunks)
+        else:
+            chunks = iter_ready_chunks()
+        
+        _post(("status", f"Step 4/5: Transcribing {total_chunks} chunks..."))
+        
+        # Progress callback that updates based on chunks
+        chunk_progress_base = 15
+        chunk_progress_range = 55  # 15% to 70%
+        
+        last_count_post = [0.0]  # Chunk counts are posted at most every 100ms
+        
+        def transcribe_progress(msg, total=None, stage=None):
+            # Chunk counts arrive as (done, total, stage); anything else is a message
+            if total is None:
+                _post(("status", f"Step 4/5: {msg}"))
+            else:
+                now = time.monotonic()
+                if msg >= total or now - last_count_post[0] >= 0.1:
+                    last_count_post[0] = now
+                    pct = min(1.0, msg / total) if total else 1.0
+                    _post(("progress", int(chunk_progress_base + pct * chunk_progress_range)))
+                    _post(("status", f"Step 4/5: Transcribed {msg}/{total} chunks..."))
+            check_stop()  # Check after each chunk
+        
+        # Stream each finished chunk into the transcript pane as it lands
+        streamed_lines = []
+        
+        def show_chunk(segments):
+            text = transcriber.format_transcript_with_timestamps({"segments": segments})
+            if text:
+                streamed_lines.append(text)
+                _post(("transcript_append", text))
+        
+        if transcriber_type == "oriserve-hindi":
+            result = transcriber.transcribe_parallel(
+                chunks,
+                progress_callback=transcribe_progress,
+                chunk_duration=chunk_duration,
+                overlap=chunk_overlap,
+                chunk_callback=show_chunk,
+                vad_filter=not skip_silence  # Speech chunks are already VAD-cut
+            )
+        else:
+            # One batched encoder/decoder call per group of chunks
+            result = transcriber.transcribe_batched(
+                chunks,
+                batch_size=min(batch_size, total_chunks),
+                progress_callback=transcribe_progress,
+                chunk_duration=chunk_duration,
+                overlap=chunk_overlap,
+                total_chunks=total_chunks,
+                chunk_callback=show_chunk
+            )
+        
+        transcript = result["text"]
+        transcript_with_timestamps = transcriber.format_transcript_with_timestamps(result)
+        
+        _post(("progress", 70))
+        check_stop()
+        
+        if not transcript.strip():
+            _post(("status", "No speech detected in video."))
+            _post(("done", None))
+            return
+        
+        # Only resend the whole transcript if merging overlapping chunks
+        # changed what was streamed
+        if "\n".join(streamed_lines) == transcript_with_timestamps:
+            _post(("transcript_done", transcript_with_timestamps))
+        else:
+            _post(("transcript", transcript_with_timestamps))
+        
+        if not keep_models:
+            # Free Whisper before BART loads so the two are never resident together
+            del transcriber
+            _release_transcribers()
+        
+        # Step 5: Summarize (70% → 100%)
+        check_stop()
+        _post(("status", "Step 5/5: Loading summarization model..."))
+        _post(("progress", 75))
+        
+        # Reuse the summarizer (and its loaded weights) across runs
+        if _summarizer is None:
+            _summarizer = Summarizer()
+        summarizer = _summarizer
+        summarizer.load_model(
+            progress_callback=lambda msg: _post(("status", f"Step 5/5: {msg}"))
+        )
+        
+        _post(("status", "Step 5/5: Generating summary..."))
+        _post(("progress", 85))
+        
+        summary = summarizer.summarize(
+            transcript,
+            word_limit=summary_words,
+            progress_callback=lambda msg: _post(("status", f"Step 5/5: {msg}"))
+        )
+        
+        _post(("progress", 100))
+        
+        # Send summary to UI
+        _post(("summary", summary))
+        
+        if not keep_models:
+            _summarizer = None
+            del summarizer
+            _free_memory()
+        
+        # Calculate elapsed time
+        elapsed = time.time() - start_time
+        mins = int(elapsed // 60)
+        secs = int(elapsed % 60)
+        
+        _post(("status", f"✅ Complete in {mins}m {secs}s! Transcript and summary generated."))
+        
+        # Cleanup
+        processor.cleanup_temp_files()
+        processor.cleanup_chunks()
+    
+    except InterruptedError:
+        _post(("status", "⏹️ Processing stopped by user"))
+        _post(("stopped", None))
+        # Cleanup on stop
+        try:
+            processor.cleanup_temp_files()
+            processor.cleanup_chunks()
+        except:
+            pass
+    
+    except Exception as e:
+        import traceback
+        error_msg = f"{str(e)}\n\nDetails:\n{traceback.format_exc()}"
+        _post(("error", error_msg))
+    
+    finally:
+        pipeline_done.set()
+        _post(("done", None))
+
+
 class FastVideoSummaryApp:
     """Optimized Video to Summary GUI Application."""
     
@@ -40,8 +402,18 @@ class FastVideoSummaryApp:
         
         self.root.configure(bg=self.bg_color)
         
-        # Message queue for thread communication
+        # Label text bound once; updates only set the variable
+        self._status_sv = tk.StringVar(value="Ready")
+        self._timer_sv = tk.StringVar(value="")
+        
+        # Message queue for thread communication. Threads wake the main loop
+        # with a <<Msg>> event, which Tk only accepts from other threads when
+        # Tcl is built with thread support (tkinter then hands the call to
+        # the main thread). Other builds poll the queue instead.
         self.message_queue = queue.Queue()
+        self._threaded_tk = self.root.tk.getboolean(
+            self.root.tk.call("info", "exists", "::tcl_platform(threaded)")
+        )
         
         # State
         self.processing = False
@@ -51,15 +423,37 @@ class FastVideoSummaryApp:
         self.current_summary = None
         self.start_time = None
         
+        # Pipeline worker process; its messages are relayed onto message_queue
+        mp_context = get_context("spawn")
+        self._worker_messages = mp_context.Queue()
+        self._stop_event = mp_context.Event()
+        self._executor = self._new_executor(mp_context)
+        threading.Thread(target=self._forward_messages, daemon=True).start()
+        
         # Build UI
         self._create_ui()
         
-        # Start message processing
-        self._process_messages()
+        # Load the default Whisper model while the user picks a video
+        self._executor.submit(
+            _prewarm_models,
+            self.transcriber_var.get(), self.model_var.get(), self.quality_var.get()
+        )
+        
+        # Drain messages when a worker signals one
+        self.root.bind("<<Msg>>", lambda event: self._drain_queue())
+        if self._threaded_tk:
+            # Messages posted before the main loop started raised no event
+            self.root.after_idle(self._drain_queue)
+        else:
+            self._poll_messages()
     
     def _create_ui(self):
         """Create the user interface."""
         
+        # Build hidden so the window is laid out once, not after every pack()
+        self.root.withdraw()
+        self._fonts = {}
+        
         # Main container with padding
         main_frame = tk.Frame(self.root, bg=self.bg_color, padx=25, pady=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -71,7 +465,7 @@ class FastVideoSummaryApp:
         title_label = tk.Label(
             header_frame,
             text="⚡ Fast Video Summary Generator",
-            font=("Segoe UI", 24, "bold"),
+            font=self._font("Segoe UI", 24, "bold"),
             bg=self.bg_color,
             fg=self.fg_color
         )
@@ -80,7 +474,7 @@ class FastVideoSummaryApp:
         subtitle_label = tk.Label(
             header_frame,
             text="1-hour video → 5-minute processing • Chunked + Parallel Transcription",
-            font=("Segoe UI", 11),
+            font=self._font("Segoe UI", 11),
             bg=self.bg_color,
             fg=self.success_color
         )
@@ -94,7 +488,7 @@ class FastVideoSummaryApp:
         tk.Label(
             settings_frame,
             text="Model:",
-            font=("Segoe UI", 11, "bold"),
+            font=self._font("Segoe UI", 11, "bold"),
             bg=self.accent_color,
             fg=self.fg_color
         ).pack(side=tk.LEFT, padx=(0, 5))
@@ -109,30 +503,30 @@ class FastVideoSummaryApp:
         )
         model_combo.pack(side=tk.LEFT, padx=(0, 20))
         
-        # Workers selection
+        # Batch size: 30s windows per batched Whisper call
         tk.Label(
             settings_frame,
-            text="Workers:",
-            font=("Segoe UI", 11, "bold"),
+            text="Batch size:",
+            font=self._font("Segoe UI", 11, "bold"),
             bg=self.accent_color,
             fg=self.fg_color
         ).pack(side=tk.LEFT, padx=(0, 5))
         
-        self.workers_var = tk.StringVar(value="4")
-        workers_combo = ttk.Combobox(
+        self.batch_var = tk.StringVar(value="16")
+        batch_combo = ttk.Combobox(
             settings_frame,
-            textvariable=self.workers_var,
-            values=["2", "4", "6", "8"],
+            textvariable=self.batch_var,
+            values=["4", "8", "16", "32"],
             state="readonly",
             width=5
         )
-        workers_combo.pack(side=tk.LEFT, padx=(0, 20))
+        batch_combo.pack(side=tk.LEFT, padx=(0, 20))
         
         # Chunk duration
         tk.Label(
             settings_frame,
             text="Chunk (sec):",
-            font=("Segoe UI", 11, "bold"),
+            font=self._font("Segoe UI", 11, "bold"),
             bg=self.accent_color,
             fg=self.fg_color
         ).pack(side=tk.LEFT, padx=(0, 5))
@@ -151,7 +545,7 @@ class FastVideoSummaryApp:
         tk.Label(
             settings_frame,
             text="Summary Words:",
-            font=("Segoe UI", 11, "bold"),
+            font=self._font("Segoe UI", 11, "bold"),
             bg=self.accent_color,
             fg=self.fg_color
         ).pack(side=tk.LEFT, padx=(0, 5))
@@ -170,7 +564,7 @@ class FastVideoSummaryApp:
         tk.Label(
             settings_frame,
             text="Transcriber:",
-            font=("Segoe UI", 11, "bold"),
+            font=self._font("Segoe UI", 11, "bold"),
             bg=self.accent_color,
             fg=self.fg_color
         ).pack(side=tk.LEFT, padx=(0, 5))
@@ -183,13 +577,60 @@ class FastVideoSummaryApp:
             state="readonly",
             width=14
         )
-        transcriber_combo.pack(side=tk.LEFT)
+        transcriber_combo.pack(side=tk.LEFT, padx=(0, 20))
+        
+        # Quality/speed (faster-whisper compute type)
+        tk.Label(
+            settings_frame,
+            text="Quality:",
+            font=self._font("Segoe UI", 11, "bold"),
+            bg=self.accent_color,
+            fg=self.fg_color
+        ).pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.quality_var = tk.StringVar(value="Auto")
+        quality_combo = ttk.Combobox(
+            settings_frame,
+            textvariable=self.quality_var,
+            values=["Auto", "Fast", "Balanced", "Accurate"],
+            state="readonly",
+            width=9
+        )
+        quality_combo.pack(side=tk.LEFT, padx=(0, 20))
+        
+        # Voice activity detection: only speech is transcribed
+        self.vad_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            settings_frame,
+            text="Skip silence",
+            variable=self.vad_var,
+            font=self._font("Segoe UI", 11, "bold"),
+            bg=self.accent_color,
+            fg=self.fg_color,
+            selectcolor=self.button_color,
+            activebackground=self.accent_color,
+            activeforeground=self.fg_color
+        ).pack(side=tk.LEFT)
+        
+        # Keep models resident between runs (off frees Whisper before BART loads)
+        self.keep_models_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            settings_frame,
+            text="Keep models",
+            variable=self.keep_models_var,
+            font=self._font("Segoe UI", 11, "bold"),
+            bg=self.accent_color,
+            fg=self.fg_color,
+            selectcolor=self.button_color,
+            activebackground=self.accent_color,
+            activeforeground=self.fg_color
+        ).pack(side=tk.LEFT, padx=(10, 0))
         
         # Speed indicator
         self.speed_label = tk.Label(
             settings_frame,
             text="⚡ Fast mode",
-            font=("Segoe UI", 10),
+            font=self._font("Segoe UI", 10),
             bg=self.accent_color,
             fg=self.success_color
         )
@@ -205,7 +646,7 @@ class FastVideoSummaryApp:
             command=self._select_video,
             bg=self.highlight_color,
             fg="white",
-            font=("Segoe UI", 13, "bold"),
+            font=self._font("Segoe UI", 13, "bold"),
             width=20,
             height=2,
             relief=tk.FLAT,
@@ -217,7 +658,7 @@ class FastVideoSummaryApp:
         self.file_label = tk.Label(
             video_frame,
             text="No file selected",
-            font=("Segoe UI", 11),
+            font=self._font("Segoe UI", 11),
             bg=self.bg_color,
             fg="#888888",
             anchor=tk.W
@@ -234,7 +675,7 @@ class FastVideoSummaryApp:
             command=self._start_processing,
             bg=self.success_color,
             fg="#1a1a2e",
-            font=("Segoe UI", 14, "bold"),
+            font=self._font("Segoe UI", 14, "bold"),
             width=35,
             height=2,
             relief=tk.FLAT,
@@ -250,7 +691,7 @@ class FastVideoSummaryApp:
             command=self._stop_processing,
             bg=self.highlight_color,
             fg="white",
-            font=("Segoe UI", 14, "bold"),
+            font=self._font("Segoe UI", 14, "bold"),
             width=10,
             height=2,
             relief=tk.FLAT,
@@ -277,8 +718,8 @@ class FastVideoSummaryApp:
         
         self.status_label = tk.Label(
             status_row,
-            text="Ready",
-            font=("Segoe UI", 11),
+            textvariable=self._status_sv,
+            font=self._font("Segoe UI", 11),
             bg=self.bg_color,
             fg=self.success_color
         )
@@ -286,8 +727,8 @@ class FastVideoSummaryApp:
         
         self.timer_label = tk.Label(
             status_row,
-            text="",
-            font=("Segoe UI", 11, "bold"),
+            textvariable=self._timer_sv,
+            font=self._font("Segoe UI", 11, "bold"),
             bg=self.bg_color,
             fg=self.warning_color
         )
@@ -300,7 +741,7 @@ class FastVideoSummaryApp:
         tk.Label(
             transcript_header,
             text="📝 Transcript",
-            font=("Segoe UI", 13, "bold"),
+            font=self._font("Segoe UI", 13, "bold"),
             bg=self.bg_color,
             fg=self.fg_color
         ).pack(side=tk.LEFT)
@@ -311,7 +752,7 @@ class FastVideoSummaryApp:
             command=self._save_transcript,
             bg=self.button_color,
             fg=self.fg_color,
-            font=("Segoe UI", 10),
+            font=self._font("Segoe UI", 10),
             relief=tk.FLAT,
             state=tk.DISABLED,
             cursor="hand2"
@@ -321,7 +762,7 @@ class FastVideoSummaryApp:
         self.transcript_text = scrolledtext.ScrolledText(
             main_frame,
             wrap=tk.WORD,
-            font=("Consolas", 10),
+            font=self._font("Consolas", 10),
             bg=self.text_bg,
             fg=self.fg_color,
             insertbackground=self.fg_color,
@@ -339,7 +780,7 @@ class FastVideoSummaryApp:
         tk.Label(
             summary_header,
             text="📋 Summary",
-            font=("Segoe UI", 13, "bold"),
+            font=self._font("Segoe UI", 13, "bold"),
             bg=self.bg_color,
             fg=self.fg_color
         ).pack(side=tk.LEFT)
@@ -350,7 +791,7 @@ class FastVideoSummaryApp:
             command=self._save_summary,
             bg=self.button_color,
             fg=self.fg_color,
-            font=("Segoe UI", 10),
+            font=self._font("Segoe UI", 10),
             relief=tk.FLAT,
             state=tk.DISABLED,
             cursor="hand2"
@@ -360,7 +801,7 @@ class FastVideoSummaryApp:
         self.summary_text = scrolledtext.ScrolledText(
             main_frame,
             wrap=tk.WORD,
-            font=("Consolas", 10),
+            font=self._font("Consolas", 10),
             bg=self.text_bg,
             fg=self.fg_color,
             insertbackground=self.fg_color,
@@ -374,12 +815,23 @@ class FastVideoSummaryApp:
         # ===== Footer =====
         footer = tk.Label(
             main_frame,
-            text="faster-whisper (Fast) | Oriserve Hindi/Hinglish (Accurate) • BART-large-CNN for summarization",
-            font=("Segoe UI", 9),
+            text="faster-whisper (Fast) | Oriserve Hindi/Hinglish (Accurate) • BART-large-CNN for summarization\n"
+                 "Batch size = 30s windows per Whisper call; larger batches are faster but use more memory",
+            font=self._font("Segoe UI", 9),
             bg=self.bg_color,
             fg="#666666"
         )
         footer.pack(pady=(10, 0))
+        
+        self.root.update_idletasks()
+        self.root.deiconify()
+    
+    def _font(self, family: str, size: int, weight: str = "normal") -> tkfont.Font:
+        """Shared named font, so Tk resolves each family/size/weight only once."""
+        key = (family, size, weight)
+        if key not in self._fonts:
+            self._fonts[key] = tkfont.Font(root=self.root, family=family, size=size, weight=weight)
+        return self._fonts[key]
     
     def _select_video(self):
         """Open file dialog to select a video file."""
@@ -431,18 +883,19 @@ class FastVideoSummaryApp:
         
         # Get settings
         model_size = self.model_var.get()
-        num_workers = int(self.workers_var.get())
+        batch_size = int(self.batch_var.get())
         chunk_duration = int(self.chunk_var.get())
         summary_words = int(self.summary_words_var.get())
         transcriber_type = self.transcriber_var.get()  # NEW: Get selected transcriber
+        quality = self.quality_var.get()
+        skip_silence = self.vad_var.get()
+        keep_models = self.keep_models_var.get()
         
-        # Process in background thread
-        thread = threading.Thread(
-            target=self._process_video_thread,
-            args=(self.current_video, model_size, num_workers, chunk_duration, summary_words, transcriber_type),
-            daemon=True
-        )
-        thread.start()
+        # Process in the worker process
+        self._stop_event.clear()
+        settings = (model_size, batch_size, chunk_duration, summary_words, transcriber_type, quality, skip_silence, keep_models)
+        future = self._executor.submit(_run_pipeline, self.current_video, settings, self.start_time)
+        future.add_done_callback(self._on_pipeline_exit)
         
         # Start timer update
         self._update_timer()
@@ -451,7 +904,9 @@ class FastVideoSummaryApp:
         """Request stop of the current processing."""
         if self.processing:
             self.stop_requested = True
-            self.status_label.configure(text="⏹️ Stopping... please wait", fg=self.warning_color)
+            self._stop_event.set()
+            self._status_sv.set("⏹️ Stopping... please wait")
+            self.status_label.configure(fg=self.warning_color)
             self.stop_btn.configure(state=tk.DISABLED)
     
     def _update_timer(self):
@@ -460,189 +915,92 @@ class FastVideoSummaryApp:
             elapsed = time.time() - self.start_time
             mins = int(elapsed // 60)
             secs = int(elapsed % 60)
-            self.timer_label.configure(text=f"⏱️ {mins:02d}:{secs:02d}")
+            self._timer_sv.set(f"⏱️ {mins:02d}:{secs:02d}")
             self.root.after(1000, self._update_timer)
     
-    def _process_video_thread(self, video_path: str, model_size: str, num_workers: int, chunk_duration: int, summary_words: int = 800, transcriber_type: str = "faster-whisper"):
-        """Process video with optimized pipeline."""
+    def _new_executor(self, mp_context=None) -> ProcessPoolExecutor:
+        """Single-process pool that runs the pipeline away from the UI's GIL."""
+        mp_context = mp_context or get_context("spawn")
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self._worker_messages, self._stop_event)
+        )
+    
+    def _forward_messages(self):
+        """Relay worker-process messages onto the UI queue (runs on a daemon thread)."""
+        while True:
+            self._post(self._worker_messages.get())
+    
+    def _on_pipeline_exit(self, future):
+        """Report a worker process that died without sending its own 'done'."""
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool):
+            # Models were lost with the process; start a fresh one
+            self._executor = self._new_executor()
+        if error is not None:
+            self._post(("error", f"Processing worker failed: {error}"))
+            self._post(("done", None))
+    
+    def _post(self, msg):
+        """Queue a (type, data) message for the UI and wake the main thread."""
+        self.message_queue.put(msg)
+        if not self._threaded_tk:
+            return  # _poll_messages picks it up
         try:
-            from src.video_processor import VideoProcessor
-            from src.summarizer import Summarizer
-            
-            # Check for stop request helper
-            def check_stop():
-                if self.stop_requested:
-                    raise InterruptedError("Processing stopped by user")
-            
-            # Step 1: Extract audio (5%)
-            self.message_queue.put(("status", "Step 1/5: Extracting audio..."))
-            self.message_queue.put(("progress", 2))
-            check_stop()
-            
-            processor = VideoProcessor()
-            
-            if not processor.is_ffmpeg_available():
-                raise RuntimeError(
-                    "FFmpeg not found!\n\n"
-                    "Please install FFmpeg and add it to your PATH.\n"
-                    "Download from: https://ffmpeg.org/download.html"
-                )
-            
-            audio_path = processor.extract_audio(
-                video_path,
-                progress_callback=lambda msg: self.message_queue.put(("status", f"Step 1/5: {msg}"))
-            )
-            self.message_queue.put(("progress", 5))
-            check_stop()
-            
-            # Step 2: Chunk audio (10%)
-            self.message_queue.put(("status", f"Step 2/5: Chunking audio ({chunk_duration}s segments)..."))
-            chunk_files = processor.chunk_audio(
-                audio_path,
-                chunk_duration=chunk_duration,
-                progress_callback=lambda msg: self.message_queue.put(("status", f"Step 2/5: {msg}"))
-            )
-            self.message_queue.put(("progress", 10))
-            check_stop()
-            
-            # Step 3: Load transcriber (15%) - CONDITIONAL BASED ON SELECTION
-            if transcriber_type == "oriserve-hindi":
-                from src.oriserve_transcriber import OriserveTranscriber
-                self.message_queue.put(("status", "Step 3/5: Loading Oriserve Hindi/Hinglish model..."))
-                transcriber = OriserveTranscriber()
-            else:
-                from src.fast_transcriber import FastTranscriber
-                self.message_queue.put(("status", f"Step 3/5: Loading Whisper {model_size} model..."))
-                transcriber = FastTranscriber(model_size=model_size, num_workers=num_workers)
-            
-            transcriber.load_model(
-                progress_callback=lambda msg: self.message_queue.put(("status", f"Step 3/5: {msg}"))
-            )
-            self.message_queue.put(("progress", 15))
-            check_stop()
-            
-            # Step 4: Parallel transcription (15% → 70%)
-            self.message_queue.put(("status", f"Step 4/5: Transcribing {len(chunk_files)} chunks in parallel..."))
-            
-            # Progress callback that updates based on chunks
-            chunk_progress_base = 15
-            chunk_progress_range = 55  # 15% to 70%
-            
-            def transcribe_progress(msg):
-                # Extract chunk progress from message
-                if "Transcribed" in msg and "/" in msg:
-                    parts = msg.split()
-                    for part in parts:
-                        if "/" in part:
-                            try:
-                                current, total = part.split("/")
-                                pct = int(current) / int(total)
-                                progress_value = chunk_progress_base + (pct * chunk_progress_range)
-                                self.message_queue.put(("progress", int(progress_value)))
-                            except:
-                                pass
-                self.message_queue.put(("status", f"Step 4/5: {msg}"))
-                check_stop()  # Check after each chunk
-            
-            result = transcriber.transcribe_parallel(
-                chunk_files,
-                progress_callback=transcribe_progress
-            )
-            
-            transcript = result["text"]
-            transcript_with_timestamps = transcriber.format_transcript_with_timestamps(result)
-            
-            self.message_queue.put(("progress", 70))
-            check_stop()
-            
-            if not transcript.strip():
-                self.message_queue.put(("status", "No speech detected in video."))
-                self.message_queue.put(("done", None))
-                return
-            
-            # Send transcript to UI
-            self.message_queue.put(("transcript", transcript_with_timestamps))
-            self.current_transcript = transcript_with_timestamps
-            
-            # Step 5: Summarize (70% → 100%)
-            check_stop()
-            self.message_queue.put(("status", "Step 5/5: Loading summarization model..."))
-            self.message_queue.put(("progress", 75))
-            
-            summarizer = Summarizer()
-            summarizer.load_model(
-                progress_callback=lambda msg: self.message_queue.put(("status", f"Step 5/5: {msg}"))
-            )
-            
-            self.message_queue.put(("status", "Step 5/5: Generating summary..."))
-            self.message_queue.put(("progress", 85))
-            
-            summary = summarizer.summarize(
-                transcript,
-                word_limit=summary_words,
-                progress_callback=lambda msg: self.message_queue.put(("status", f"Step 5/5: {msg}"))
-            )
-            
-            self.message_queue.put(("progress", 100))
-            
-            # Send summary to UI
-            self.message_queue.put(("summary", summary))
-            self.current_summary = summary
-            
-            # Calculate elapsed time
-            elapsed = time.time() - self.start_time
-            mins = int(elapsed // 60)
-            secs = int(elapsed % 60)
-            
-            self.message_queue.put(("status", f"✅ Complete in {mins}m {secs}s! Transcript and summary generated."))
-            
-            # Cleanup
-            processor.cleanup_temp_files()
-            processor.cleanup_chunks()
-            
-        except InterruptedError:
-            self.message_queue.put(("status", "⏹️ Processing stopped by user"))
-            self.message_queue.put(("stopped", None))
-            # Cleanup on stop
-            try:
-                processor.cleanup_temp_files()
-                processor.cleanup_chunks()
-            except:
-                pass
-        
-        except Exception as e:
-            import traceback
-            error_msg = f"{str(e)}\n\nDetails:\n{traceback.format_exc()}"
-            self.message_queue.put(("error", error_msg))
-        
-        finally:
-            self.message_queue.put(("done", None))
+            self.root.event_generate("<<Msg>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass  # Main loop not running yet (drained once it starts) or window closing
+    
+    def _poll_messages(self):
+        """Drain the queue every 100ms, for Tcl builds without thread support."""
+        self._drain_queue()
+        self.root.after(100, self._poll_messages)
     
-    def _process_messages(self):
+    def _drain_queue(self):
         """Process messages from background thread (runs on main thread)."""
         try:
             while True:
                 msg_type, msg_data = self.message_queue.get_nowait()
                 
                 if msg_type == "status":
-                    self.status_label.configure(text=msg_data)
+                    self._status_sv.set(msg_data)
                     
                 elif msg_type == "progress":
                     self.progress["value"] = msg_data
                     
                 elif msg_type == "transcript":
+                    self.current_transcript = msg_data
                     self.transcript_text.delete(1.0, tk.END)
                     self.transcript_text.insert(tk.END, msg_data)
                     self.save_transcript_btn.configure(state=tk.NORMAL)
                     
+                elif msg_type == "transcript_append":
+                    self.transcript_text.insert(tk.END, msg_data + "\n")
+                    self.transcript_text.see(tk.END)
+                    
+                elif msg_type == "transcript_done":
+                    self.current_transcript = msg_data
+                    self.save_transcript_btn.configure(state=tk.NORMAL)
+                    
                 elif msg_type == "summary":
+                    self.current_summary = msg_data
                     self.summary_text.delete(1.0, tk.END)
                     self.summary_text.insert(tk.END, msg_data)
                     self.save_summary_btn.configure(state=tk.NORMAL)
                     
+                elif msg_type == "saved":
+                    button, message = msg_data
+                    button.configure(state=tk.NORMAL, text="💾 Save")
+                    if message:
+                        self._status_sv.set("💾 Saved")
+                        messagebox.showinfo("Saved", message)
+                    
                 elif msg_type == "error":
                     messagebox.showerror("Error", msg_data)
-                    self.status_label.configure(text="❌ Error occurred", fg=self.highlight_color)
+                    self._status_sv.set("❌ Error occurred")
+                    self.status_label.configure(fg=self.highlight_color)
                     
                 elif msg_type == "done":
                     self.select_btn.configure(state=tk.NORMAL)
@@ -661,9 +1019,6 @@ class FastVideoSummaryApp:
                     
         except queue.Empty:
             pass
-        
-        # Schedule next check
-        self.root.after(100, self._process_messages)
     
     def _save_transcript(self):
         """Save transcript to file."""
@@ -686,9 +1041,7 @@ class FastVideoSummaryApp:
         )
         
         if filepath:
-            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-            Path(filepath).write_text(self.current_transcript, encoding="utf-8")
-            messagebox.showinfo("Saved", f"Transcript saved to:\n{filepath}")
+            self._save_async(filepath, self.current_transcript, self.save_transcript_btn, "Transcript")
     
     def _save_summary(self):
         """Save summary to file."""
@@ -711,13 +1064,33 @@ class FastVideoSummaryApp:
         )
         
         if filepath:
-            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-            Path(filepath).write_text(self.current_summary, encoding="utf-8")
-            messagebox.showinfo("Saved", f"Summary saved to:\n{filepath}")
+            self._save_async(filepath, self.current_summary, self.save_summary_btn, "Summary")
+    
+    def _save_async(self, filepath: str, text: str, button, label: str):
+        """Write text to filepath on a daemon thread, keeping the UI responsive."""
+        button.configure(state=tk.DISABLED, text="⏳ Saving...")
+        
+        def write():
+            try:
+                Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+                with io.open(filepath, "wb", buffering=1 << 20) as f:
+                    # Encode in slices so a huge transcript isn't copied in one go
+                    for start in range(0, len(text), 1 << 20):
+                        f.write(text[start:start + (1 << 20)].encode("utf-8"))
+                self._post(("saved", (button, f"{label} saved to:\n{filepath}")))
+            except OSError as e:
+                self._post(("saved", (button, None)))
+                self._post(("error", f"Could not save {label.lower()}:\n{e}"))
+        
+        threading.Thread(target=write, daemon=True).start()
     
     def run(self):
         """Run the application."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._stop_event.set()
+            self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
@@ -16,9 +16,29 @@ import os
 import shutil
 from pathlib import Path
 import platform
+import functools
 import urllib.request
+import hashlib
+import json
 import zipfile
 import tempfile
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+IS_WINDOWS = platform.system() == "Windows"
+
+# FFmpeg build installed on Windows: gyan.dev's 6.0 essentials build, as
+# repackaged in the ffmpeg-binaries 1.1.0 wheel. PyPI never replaces a
+# released file, so the URL and its digest stay valid together; bump all
+# three together.
+FFMPEG_VERSION = "6.0"
+FFMPEG_URL = (
+    "https://files.pythonhosted.org/packages/00/ba/b3b0bc096cf3662a7a771976145d060e6fdc5d51360d18adfc918ebdd017/"
+    "ffmpeg_binaries-1.1.0-py3-none-win_amd64.whl"
+)
+FFMPEG_SHA256 = "8d5fbaf2d28fcc72e8d2c22628977cf8863641592c9ec15358290490f9195b9e"
+# Folder inside the wheel holding bin/ (ffmpeg.exe, ffprobe.exe)
+FFMPEG_ARCHIVE_ROOT = "ffmpeg/binaries/"
 
 # Colors for terminal output
 class Colors:
@@ -80,11 +100,36 @@ def check_pip():
     print_error("pip not found. Please install pip first.")
     return False
 
+@functools.lru_cache(maxsize=None)
+def _find_ffmpeg():
+    """
+    Locate FFmpeg on PATH or in the common Windows install folders.
+    
+    Returns:
+        (path, on_path) tuple, or (None, False) if not found
+    """
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path:
+        return ffmpeg_path, True
+    
+    # Check common Windows paths
+    if IS_WINDOWS:
+        common_paths = [
+            r"C:\ffmpeg\bin\ffmpeg.exe",
+            r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
+            r"C:\Program Files (x86)\ffmpeg\bin\ffmpeg.exe",
+        ]
+        for path in common_paths:
+            if Path(path).exists():
+                return path, False
+    
+    return None, False
+
 def check_ffmpeg():
     """Check if FFmpeg is installed and accessible."""
-    ffmpeg_path = shutil.which("ffmpeg")
+    ffmpeg_path, on_path = _find_ffmpeg()
     
-    if ffmpeg_path:
+    if ffmpeg_path and on_path:
         try:
             result = subprocess.run(
                 [ffmpeg_path, "-version"],
@@ -95,19 +140,10 @@ def check_ffmpeg():
             return True
         except Exception:
             pass
-    
-    # Check common Windows paths
-    if platform.system() == "Windows":
-        common_paths = [
-            r"C:\ffmpeg\bin\ffmpeg.exe",
-            r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
-            r"C:\Program Files (x86)\ffmpeg\bin\ffmpeg.exe",
-        ]
-        for path in common_paths:
-            if Path(path).exists():
-                print_success(f"FFmpeg found at: {path}")
-                print_warning("FFmpeg is not in PATH. Consider adding it.")
-                return True
+    elif ffmpeg_path:
+        print_success(f"FFmpeg found at: {ffmpeg_path}")
+        print_warning("FFmpeg is not in PATH. Consider adding it.")
+        return True
     
     print_error("FFmpeg NOT FOUND")
     return False
@@ -124,12 +160,68 @@ def check_tkinter():
             print_info("Install with: sudo apt-get install python3-tk")
         return False
 
+def download_file(url, dest_path, block_size=1 << 20):
+    """
+    Stream a URL to disk in fixed-size blocks, printing progress.
+    
+    Returns:
+        SHA256 hex digest of the downloaded bytes
+    """
+    digest = hashlib.sha256()
+    written = 0
+    
+    with urllib.request.urlopen(url) as response, open(dest_path, 'wb') as f:
+        total = int(response.headers.get("Content-Length") or 0)
+        while True:
+            buf = response.read(block_size)
+            if not buf:
+                break
+            f.write(buf)
+            digest.update(buf)
+            written += len(buf)
+            if total:
+                print(f"\r  {written / 1e6:.1f} / {total / 1e6:.1f} MB ({100 * written // total}%)", end="", flush=True)
+            else:
+                print(f"\r  {written / 1e6:.1f} MB", end="", flush=True)
+    print()
+    
+    return digest.hexdigest()
+
+def extract_ffmpeg_zip(zip_path, install_path, block_size=1 << 20):
+    """
+    Extract the FFmpeg build zip into install_path in one pass.
+    
+    Only the build under FFMPEG_ARCHIVE_ROOT is extracted, with that
+    prefix stripped so bin/ lands directly under install_path; the
+    wheel's Python package around it is skipped.
+    """
+    made_dirs = set()
+    
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        members = [
+            zi for zi in zip_ref.infolist()
+            if not zi.is_dir() and zi.filename.startswith(FFMPEG_ARCHIVE_ROOT)
+        ]
+        if not members:
+            raise Exception("Failed to find FFmpeg folder in archive")
+        
+        for zi in members:
+            parts = zi.filename[len(FFMPEG_ARCHIVE_ROOT):].split("/")
+            if not parts or ".." in parts:
+                continue
+            dest = install_path.joinpath(*parts)
+            
+            if dest.parent not in made_dirs:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(dest.parent)
+            
+            with zip_ref.open(zi) as src, open(dest, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=block_size)
+
 def install_ffmpeg_windows():
     """Download and install FFmpeg on Windows."""
     print_info("Downloading FFmpeg for Windows...")
     
-    # FFmpeg download URL (gyan.dev builds - reliable source)
-    ffmpeg_url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
     install_path = Path("C:/ffmpeg")
     
     try:
@@ -137,27 +229,26 @@ def install_ffmpeg_windows():
         with tempfile.TemporaryDirectory() as tmp_dir:
             zip_path = Path(tmp_dir) / "ffmpeg.zip"
             
-            print_info("Downloading FFmpeg (~80MB)... This may take a few minutes.")
-            urllib.request.urlretrieve(ffmpeg_url, zip_path)
+            print_info(f"Downloading FFmpeg {FFMPEG_VERSION} (~90MB)... This may take a few minutes.")
+            digest = download_file(FFMPEG_URL, zip_path)
             print_success("Download complete!")
             
-            # Extract
-            print_info("Extracting...")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(tmp_dir)
-            
-            # Find extracted folder
-            extracted_dirs = [d for d in Path(tmp_dir).iterdir() if d.is_dir() and d.name.startswith("ffmpeg")]
-            if not extracted_dirs:
-                raise Exception("Failed to find extracted FFmpeg folder")
+            # Never install a build that doesn't match the pinned digest
+            if digest != FFMPEG_SHA256:
+                raise Exception(f"Checksum mismatch (expected {FFMPEG_SHA256}, got {digest})")
+            print_success("Checksum verified")
             
-            extracted_path = extracted_dirs[0]
+            # Extract next to the install location, then swap it in with a
+            # rename so a failed extract never leaves a half-written install
+            print_info("Extracting...")
+            staging_path = install_path.with_name(install_path.name + ".new")
+            if staging_path.exists():
+                shutil.rmtree(staging_path)
+            extract_ffmpeg_zip(zip_path, staging_path)
             
-            # Move to install location
             if install_path.exists():
                 shutil.rmtree(install_path)
-            
-            shutil.copytree(extracted_path, install_path)
+            shutil.move(str(staging_path), str(install_path))
             print_success(f"FFmpeg installed to: {install_path}")
             
             # Add to PATH for current session
@@ -189,6 +280,14 @@ def upgrade_pip():
         print_warning("Failed to upgrade pip, continuing anyway...")
         return True
 
+def pip_supports_feature(feature):
+    """Check whether this pip accepts --use-feature=<feature>."""
+    result = subprocess.run(
+        [sys.executable, "-m", "pip", "install", f"--use-feature={feature}", "--help"],
+        capture_output=True, text=True
+    )
+    return result.returncode == 0
+
 def install_requirements():
     """Install Python packages from requirements.txt."""
     req_file = Path(__file__).parent / "requirements.txt"
@@ -200,11 +299,20 @@ def install_requirements():
     print_info("Installing Python packages... This may take several minutes.")
     print_info("(PyTorch and Transformers are large downloads)")
     
+    # Wheels only: never fall into a slow source build of numpy/scipy
+    cmd = [sys.executable, "-m", "pip", "install", "--prefer-binary", "--no-input"]
+    if pip_supports_feature("fast-deps"):
+        cmd.append("--use-feature=fast-deps")
+    
     result = subprocess.run(
-        [sys.executable, "-m", "pip", "install", "-r", str(req_file)],
+        cmd + ["--only-binary=:all:", "-r", str(req_file)],
         capture_output=False  # Show live output
     )
     
+    if result.returncode != 0:
+        print_warning("Binary-only install failed, retrying with source builds allowed...")
+        result = subprocess.run(cmd + ["-r", str(req_file)], capture_output=False)
+    
     if result.returncode == 0:
         print_success("All Python packages installed successfully!")
         return True
@@ -212,56 +320,52 @@ def install_requirements():
         print_error("Some packages failed to install")
         return False
 
+# Imports every runtime package in a child interpreter and reports back as JSON
+VERIFY_SCRIPT = """
+import json
+results = {}
+for label, module, attrs in [
+    ("faster-whisper", "faster_whisper", ["WhisperModel"]),
+    ("transformers", "transformers", ["BartForConditionalGeneration", "BartTokenizerFast"]),
+    ("torch", "torch", []),
+    ("numpy", "numpy", []),
+    ("scipy", "scipy", []),
+]:
+    try:
+        mod = __import__(module, fromlist=attrs)
+        for attr in attrs:
+            getattr(mod, attr)
+        results[label] = [True, getattr(mod, "__version__", None) if not attrs else None]
+    except Exception as e:
+        results[label] = [False, str(e)]
+print(json.dumps(results))
+"""
+
 def verify_installation():
     """Verify all components are working."""
     print("\nVerifying installation...")
     
+    # Import in a subprocess so setup.py itself never loads torch & co.
+    result = subprocess.run(
+        [sys.executable, "-c", VERIFY_SCRIPT],
+        capture_output=True, text=True
+    )
+    try:
+        results = json.loads(result.stdout.strip().splitlines()[-1])
+    except (ValueError, IndexError):
+        print_error(f"Verification failed to run: {result.stderr.strip()[-200:]}")
+        return False
+    
     checks = []
     
-    # Check faster-whisper
-    try:
-        from faster_whisper import WhisperModel
-        print_success("faster-whisper: OK")
-        checks.append(True)
-    except ImportError as e:
-        print_error(f"faster-whisper: FAILED ({e})")
-        checks.append(False)
-    
-    # Check transformers
-    try:
-        from transformers import BartForConditionalGeneration, BartTokenizer
-        print_success("transformers: OK")
-        checks.append(True)
-    except ImportError as e:
-        print_error(f"transformers: FAILED ({e})")
-        checks.append(False)
-    
-    # Check torch
-    try:
-        import torch
-        print_success(f"torch: OK (version {torch.__version__})")
-        checks.append(True)
-    except ImportError as e:
-        print_error(f"torch: FAILED ({e})")
-        checks.append(False)
-    
-    # Check numpy
-    try:
-        import numpy as np
-        print_success(f"numpy: OK (version {np.__version__})")
-        checks.append(True)
-    except ImportError as e:
-        print_error(f"numpy: FAILED ({e})")
-        checks.append(False)
-    
-    # Check scipy
-    try:
-        import scipy
-        print_success(f"scipy: OK (version {scipy.__version__})")
-        checks.append(True)
-    except ImportError as e:
-        print_error(f"scipy: FAILED ({e})")
-        checks.append(False)
+    for label, (ok, detail) in results.items():
+        if not ok:
+            print_error(f"{label}: FAILED ({detail})")
+        elif detail:
+            print_success(f"{label}: OK (version {detail})")
+        else:
+            print_success(f"{label}: OK")
+        checks.append(ok)
     
     return all(checks)
 
@@ -269,36 +373,48 @@ def pre_download_models():
     """Optionally pre-download ML models."""
     print("\nModels will be downloaded on first run (~2GB total):")
     print("  • Whisper small model: ~244 MB")
-    print("  • DistilBART summarization model: ~1.2 GB")
+    print("  • DistilBART summarization model: ~1.0 GB")
     
     response = input("\nPre-download models now? [y/N]: ").strip().lower()
     
     if response == 'y':
-        print_info("Downloading Whisper model...")
-        try:
+        # hf_transfer splits each file into parallel range requests; the
+        # hub refuses the flag when the package is missing, so only set it
+        # when it is installed
+        if importlib.util.find_spec("hf_transfer") is not None:
+            os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+        
+        def download_whisper():
             from faster_whisper import WhisperModel
             models_dir = Path(__file__).parent / "models" / "faster-whisper"
             models_dir.mkdir(parents=True, exist_ok=True)
             
             model = WhisperModel("small", device="cpu", compute_type="int8", download_root=str(models_dir))
             del model
-            print_success("Whisper model downloaded!")
-        except Exception as e:
-            print_error(f"Failed to download Whisper model: {e}")
         
-        print_info("Downloading DistilBART model...")
-        try:
-            from transformers import BartForConditionalGeneration, BartTokenizer
-            model_name = "sshleifer/distilbart-cnn-12-6"
+        def download_distilbart():
+            from transformers import BartForConditionalGeneration, BartTokenizerFast
+            model_name = "sshleifer/distilbart-cnn-12-3"  # Summarizer's default preset
             models_dir = Path(__file__).parent / "models" / "distilbart"
             models_dir.mkdir(parents=True, exist_ok=True)
             
-            tokenizer = BartTokenizer.from_pretrained(model_name, cache_dir=str(models_dir))
+            tokenizer = BartTokenizerFast.from_pretrained(model_name, cache_dir=str(models_dir))
             model = BartForConditionalGeneration.from_pretrained(model_name, cache_dir=str(models_dir))
             del tokenizer, model
-            print_success("DistilBART model downloaded!")
-        except Exception as e:
-            print_error(f"Failed to download DistilBART model: {e}")
+        
+        # The two downloads are independent, so fetch them side by side
+        print_info("Downloading Whisper and DistilBART models...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                "Whisper": executor.submit(download_whisper),
+                "DistilBART": executor.submit(download_distilbart),
+            }
+            for name, future in futures.items():
+                try:
+                    future.result()
+                    print_success(f"{name} model downloaded!")
+                except Exception as e:
+                    print_error(f"Failed to download {name} model: {e}")
 
 def create_directories():
     """Create necessary project directories."""
@@ -347,9 +463,10 @@ def main():
     ffmpeg_ok = check_ffmpeg()
     
     if not ffmpeg_ok and not check_only:
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             if auto_install or input("\nInstall FFmpeg automatically? [Y/n]: ").strip().lower() != 'n':
                 install_ffmpeg_windows()
+                _find_ffmpeg.cache_clear()
                 ffmpeg_ok = check_ffmpeg()
         else:
             print_info("Please install FFmpeg manually:")
@@ -1,21 +1,82 @@
 """
 Fast Transcriber Module
-High-speed speech-to-text using faster-whisper with parallel chunk processing.
+High-speed speech-to-text using faster-whisper with batched chunk processing.
 Optimized for meeting transcription - processes 1 hour in ~3 minutes.
 """
 
 import os
+import functools
+import itertools
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import warnings
 import threading
+import weakref
+
+
+def performance_cpus() -> set:
+    """
+    CPUs this process may run on, minus the efficiency cluster on hybrid
+    (big.LITTLE, P/E-core) chips: cores whose cpuinfo_max_freq is well
+    below the fastest core's are dropped. Empty where affinity is unsupported.
+    """
+    try:
+        cpus = os.sched_getaffinity(0)
+    except AttributeError:  # Not available on Windows/macOS
+        return set()
+    
+    freqs = {}
+    for cpu in cpus:
+        try:
+            with open(f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/cpuinfo_max_freq") as f:
+                freqs[cpu] = int(f.read())
+        except (OSError, ValueError):
+            return cpus  # No cpufreq info: treat all cores alike
+    
+    # 80% keeps "preferred core" boost bins, which differ by only a few percent
+    fastest = max(freqs.values(), default=0)
+    return {cpu for cpu, freq in freqs.items() if freq >= 0.8 * fastest} or cpus
+
+
+def available_cores() -> int:
+    """
+    CPUs left for Whisper: the performance cores this process may run on
+    (respects taskset and container limits), minus one for FFmpeg decoding
+    and the UI.
+    """
+    cores = len(performance_cpus()) or os.cpu_count() or 1
+    return max(1, cores - 1)
+
+
+@functools.lru_cache(maxsize=None)
+def configure_cpu_threads():
+    """
+    Pin this process for Whisper: once per process, and only on request.
+    
+    Moves the process off efficiency cores, as a matmul split across fast
+    and slow cores waits for the slow ones. Then sizes the OpenMP/MKL
+    pools, unless the environment already does. CTranslate2 workers divide
+    these cores (cpu_threads = cores // num_workers), never multiply them;
+    each OpenMP thread stays on the core next to its siblings.
+    
+    Call it before CTranslate2 (or any other OpenMP library) loads: the
+    pools are sized when the runtime starts.
+    """
+    cpus = performance_cpus()
+    if cpus and cpus != os.sched_getaffinity(0):
+        os.sched_setaffinity(0, cpus)
+    
+    os.environ.setdefault("OMP_NUM_THREADS", str(available_cores()))
+    os.environ.setdefault("MKL_NUM_THREADS", str(available_cores()))
+    os.environ.setdefault("OMP_PROC_BIND", "close")
 
-# Try to import psutil for CPU monitoring (optional dependency)
 try:
-    import psutil
-    HAS_PSUTIL = True
-except ImportError:
-    HAS_PSUTIL = False
+    from .merge import merge_overlapping
+    from .progress import count_reporter
+    from .video_processor import read_wav
+except ImportError:  # Running this file directly
+    from merge import merge_overlapping
+    from progress import count_reporter
+    from video_processor import read_wav
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -27,6 +88,30 @@ MODELS_DIR = PROJECT_ROOT / "models" / "faster-whisper"
 MODELS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Mel filterbanks keyed by (sampling_rate, n_fft, n_mels), shared by every
+# loaded model so switching model size or quality reuses the same matrix
+_MEL_FILTERS = {}
+
+
+def _shared_mel_filters(extractor):
+    """Return the process-wide read-only copy of an extractor's mel filterbank."""
+    import numpy as np
+    
+    key = (extractor.sampling_rate, extractor.n_fft, extractor.mel_filters.shape[0])
+    if key not in _MEL_FILTERS:
+        filters = np.ascontiguousarray(extractor.mel_filters, dtype=np.float32)
+        filters.setflags(write=False)
+        _MEL_FILTERS[key] = filters
+    return _MEL_FILTERS[key]
+
+
+# Loaded models keyed by (size, compute type, device, threads, workers), so
+# transcribers with the same settings share weights. Entries are weak: a
+# model is freed once no transcriber holds it (see FastTranscriber.release)
+_MODEL_CACHE = weakref.WeakValueDictionary()
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
 class FastTranscriber:
     """High-speed transcription using faster-whisper with parallel processing."""
     
@@ -39,18 +124,64 @@ class FastTranscriber:
         "large-v3": {"size": "~1.5 GB", "speed": "slow", "accuracy": "best"},
     }
     
-    def __init__(self, model_size: str = "small", num_workers: int = 4):
+    # Quality/speed presets mapped to CTranslate2 compute types (None = auto)
+    QUALITY_PRESETS = {
+        "Auto": None,
+        "Fast": "int8",
+        "Balanced": "int8_float16",
+        "Accurate": "float16",
+    }
+    
+    # "Auto" compute types, best first: int8 weights with the widest fast
+    # activation type the device supports (bf16 on AMX, fp16 on GPUs)
+    AUTO_COMPUTE_TYPES = {
+        "cuda": ("int8_float16", "int8_bfloat16", "int8"),
+        "cpu": ("int8_bfloat16", "int8_float16", "int8"),
+    }
+    
+    # Default 30s windows encoded per batched CTranslate2 call (bounds memory)
+    MAX_BATCH_SIZE = 16
+    
+    # Speech segments of one chunk decoded together by transcribe_chunk
+    SEGMENT_BATCH_SIZE = 8
+    
+    # Chunks this short or shorter go to the process backend under "auto"...
+    SHORT_CHUNK_SECONDS = 10.0
+    # ...but only with at least this much audio in total: each spawned
+    # worker pays a full model load before its first chunk
+    MIN_PROCESS_SECONDS = 600.0
+    
+    # Windows more likely silence than speech are dropped (faster-whisper default)
+    NO_SPEECH_THRESHOLD = 0.6
+    
+    def __init__(self, model_size: str = "small", num_workers: int = 1, compute_type: str = None,
+                 cpu_threads: int = None):
         """
         Initialize the fast transcriber.
         
         Args:
             model_size: Whisper model size (tiny/base/small/medium/large-v3)
                        Default is 'small' for optimal speed/accuracy balance.
-            num_workers: Number of parallel workers for chunk processing
+            num_workers: CTranslate2 workers, i.e. chunks transcribe_parallel
+                         runs concurrently. Keep at 1 for transcribe_batched,
+                         which wants every core on one call.
+            compute_type: CTranslate2 compute type. Default (or a type the
+                         device can't run) picks the best int8 mixed-precision
+                         type the device supports.
+            cpu_threads: Threads per CTranslate2 worker. Default splits the
+                         available cores evenly between the workers.
         """
         self.model_size = model_size
-        self.num_workers = num_workers
+        self.available_cores = available_cores()
+        # Too few cores to split: one worker gets them all
+        self.num_workers = num_workers if self.available_cores > 2 else 1
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.device = None
         self.model = None
+        self.batched_model = None
+        self._transcribe_vad = None
+        self._transcribe_plain = None
         self.model_dir = str(MODELS_DIR)
         
         # Validate model size
@@ -74,16 +205,71 @@ class FastTranscriber:
             info = self.MODEL_INFO[self.model_size]
             progress_callback(f"Loading Whisper {self.model_size} model ({info['size']})...")
         
+        # No-op if the pipeline worker already did it, before anything loaded OpenMP
+        configure_cpu_threads()
+        
         try:
+            import ctranslate2
             from faster_whisper import WhisperModel
             
-            # Load model with CPU optimization
-            self.model = WhisperModel(
-                self.model_size,
-                device="cpu",
-                compute_type="int8",  # Faster on CPU
-                download_root=self.model_dir
+            # Quantized weights, with mixed-precision activations where supported
+            self.device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+            supported = ctranslate2.get_supported_compute_types(self.device)
+            if self.compute_type not in supported:
+                # Auto, or a preset this device can't run (e.g. float16 on
+                # a CPU without AVX512-FP16): use the best supported type
+                self.compute_type = next(
+                    (ct for ct in self.AUTO_COMPUTE_TYPES[self.device] if ct in supported),
+                    "default"
+                )
+            
+            # Available cores are split evenly between CTranslate2 workers
+            # (inter-op); each worker runs one chunk at a time (intra-op)
+            workers = max(1, self.num_workers)
+            cpu_threads = self.cpu_threads or max(1, self.available_cores // workers)
+            key = (self.model_size, self.compute_type, self.device, cpu_threads, workers)
+            
+            with _MODEL_CACHE_LOCK:
+                self.model = _MODEL_CACHE.get(key)
+                if self.model is None:
+                    self.model = WhisperModel(
+                        self.model_size,
+                        device=self.device,
+                        compute_type=self.compute_type,
+                        cpu_threads=cpu_threads,
+                        num_workers=workers,
+                        download_root=self.model_dir
+                    )
+                    _MODEL_CACHE[key] = self.model
+            extractor = self.model.feature_extractor
+            extractor.mel_filters = _shared_mel_filters(extractor)
+            
+            try:
+                from faster_whisper import BatchedInferencePipeline
+                self.batched_model = BatchedInferencePipeline(model=self.model)
+            except ImportError:
+                self.batched_model = None  # faster-whisper < 1.1
+            
+            # Decoding options bound once; transcribe_chunk only passes audio
+            options = dict(
+                beam_size=1,          # Greedy decoding - 5x faster than beam_size=5
+                best_of=1,            # No sampling variations
+                word_timestamps=False,  # Don't need word-level timestamps
+                condition_on_previous_text=False  # Faster, each chunk independent
+            )
+            vad_options = dict(
+                vad_filter=True,      # Remove silence
+                vad_parameters={"min_silence_duration_ms": 300},
+                **options
             )
+            self._transcribe_plain = functools.partial(self.model.transcribe, vad_filter=False, **options)
+            if self.batched_model is not None:
+                # The chunk's VAD speech segments are encoded and decoded together
+                self._transcribe_vad = functools.partial(
+                    self.batched_model.transcribe, batch_size=self.SEGMENT_BATCH_SIZE, **vad_options
+                )
+            else:
+                self._transcribe_vad = functools.partial(self.model.transcribe, **vad_options)
             
             if progress_callback:
                 progress_callback(f"Whisper {self.model_size} model loaded!")
@@ -94,41 +280,85 @@ class FastTranscriber:
                 "Install with: pip install faster-whisper"
             )
     
-    def transcribe_chunk(self, chunk_path: str) -> dict:
+    def release(self):
+        """Drop this transcriber's model; it is freed once no other transcriber shares it."""
+        self.model = None
+        self.batched_model = None
+        self._transcribe_vad = None
+        self._transcribe_plain = None
+    
+    def _start_transcription(self, chunk_path, vad_filter: bool) -> tuple:
+        """
+        Begin transcribing one chunk; returns faster-whisper's lazy (segments, info).
+        
+        The transcribe partials are only bound once the model is loaded,
+        so checking one of them stands in for "is the model loaded?".
+        """
+        if self._transcribe_plain is None:
+            self.load_model()
+        
+        # Chunk WAVs are read straight into memory rather than through PyAV
+        if isinstance(chunk_path, (str, Path)):
+            audio = read_wav(chunk_path)
+            if audio is not None:
+                chunk_path = audio
+        
+        # Optimized settings for speed, bound in load_model()
+        transcribe = self._transcribe_vad if vad_filter else self._transcribe_plain
+        return transcribe(chunk_path)
+    
+    def iter_segments(self, chunk_path, vad_filter: bool = True):
+        """
+        Yield a chunk's segments while they are decoded, without collecting them.
+        
+        Args:
+            chunk_path: Path to the audio chunk file, or 16kHz float32 samples
+            vad_filter: Run Silero VAD on the chunk (see transcribe_chunk)
+            
+        Yields:
+            {"start", "end", "text"} dicts, timestamps relative to the chunk
+        """
+        segments, _ = self._start_transcription(chunk_path, vad_filter)
+        for seg in segments:
+            yield {"start": seg.start, "end": seg.end, "text": seg.text.strip()}
+    
+    def transcribe_chunk(self, chunk_path, vad_filter: bool = True, want_segments: bool = True) -> dict:
         """
         Transcribe a single audio chunk with optimized settings.
         
         Args:
-            chunk_path: Path to the audio chunk file
+            chunk_path: Path to the audio chunk file, or 16kHz float32 samples
+            vad_filter: Run Silero VAD on the chunk; pass False for chunks that
+                        are already speech-only (VideoProcessor.iter_speech_chunks)
+            want_segments: Build timestamped segments; pass False when only the
+                           text is needed (e.g. straight into the summarizer)
             
         Returns:
-            Dictionary with text and segments
+            Dictionary with text and segments (empty if not want_segments)
         """
-        if self.model is None:
-            self.load_model()
-        
-        # Optimized settings for speed
-        segments, info = self.model.transcribe(
-            chunk_path,
-            beam_size=1,          # Greedy decoding - 5x faster than beam_size=5
-            best_of=1,            # No sampling variations
-            vad_filter=True,      # Remove silence
-            vad_parameters=dict(min_silence_duration_ms=300),
-            word_timestamps=False,  # Don't need word-level timestamps
-            condition_on_previous_text=False  # Faster, each chunk independent
-        )
+        segments, info = self._start_transcription(chunk_path, vad_filter)
         
         # Collect segments - force iteration (segments is a generator)
+        if not want_segments:
+            # Whisper segment text already starts with a space
+            return {
+                "text": "".join(seg.text for seg in segments).strip(),
+                "segments": [],
+                "language": info.language
+            }
+        
         segment_list = []
         full_text = []
         
         for seg in segments:
+            text = seg.text.strip()
             segment_list.append({
                 "start": seg.start,
                 "end": seg.end,
-                "text": seg.text.strip()
+                "text": text
             })
-            full_text.append(seg.text.strip())
+            if text:
+                full_text.append(text)
         
         return {
             "text": " ".join(full_text),
@@ -136,36 +366,183 @@ class FastTranscriber:
             "language": info.language
         }
     
-    def _get_cpu_utilization(self) -> float:
-        """Get current CPU utilization percentage (0-100)."""
-        if not HAS_PSUTIL:
-            return 50.0  # Assume moderate load if psutil not available
-        try:
-            return psutil.cpu_percent(interval=0.5)
-        except Exception:
-            return 50.0
-    
-    def _should_use_parallel(self) -> bool:
+    def transcribe_parallel(self, chunk_files: list, progress_callback=None,
+                            chunk_duration: float = 30.0, overlap: float = 0.0,
+                            chunk_callback=None, vad_filter: bool = True,
+                            want_segments: bool = True, backend: str = "auto") -> dict:
         """
-        Determine if parallel processing should be used based on CPU utilization.
-        Returns True if CPU has headroom for parallel workers.
+        Transcribe audio chunks concurrently on one shared model.
+        
+        CTranslate2 releases the GIL during inference, so with `num_workers`
+        model workers that many transcribe() calls overlap; one chunk's VAD
+        and log-mel front-end run while another is being decoded.
+        
+        The "process" backend sidesteps the GIL entirely for Python-heavy
+        post-processing: `num_workers` spawned processes each load their own
+        model once (so memory grows per worker) and read chunk audio from one
+        shared-memory block instead of receiving pickled arrays.
+        
+        Args:
+            chunk_files: List of audio chunk file paths or 16kHz float32 arrays,
+                         optionally as (chunk, start_seconds) tuples
+            progress_callback: Optional callback for progress updates
+            chunk_duration: Start spacing assumed for bare chunks without a
+                            start offset (default: 30)
+            overlap: Seconds each chunk runs into the next one (default: 0)
+            chunk_callback: Optional callback receiving each finished chunk's
+                            segments (absolute timestamps), in chunk order
+            vad_filter: Re-run VAD inside each chunk (default: True); pass
+                        False when the chunks were cut from speech regions
+            want_segments: Keep timestamped segments (default: True); False
+                           returns text only, for summary-only pipelines
+            backend: "thread", "process", or "auto" (default): processes
+                     only with several workers and at least
+                     MIN_PROCESS_SECONDS of short chunks, where per-chunk
+                     Python work outweighs the workers' model loads
+            
+        Returns:
+            Dictionary with combined text and segments
         """
-        cpu_usage = self._get_cpu_utilization()
-        # If CPU is already >70% utilized, faster-whisper is using it well
-        # No benefit from parallel workers, might even slow things down
-        return cpu_usage < 70.0
+        chunks = [self._split_chunk(chunk, idx, chunk_duration) for idx, chunk in enumerate(chunk_files)]
+        workers = max(1, self.num_workers)
+        
+        if backend == "auto":
+            total = self._total_chunk_seconds(chunks, chunk_duration)
+            short = bool(chunks) and total / len(chunks) <= self.SHORT_CHUNK_SECONDS
+            use_processes = workers > 1 and short and total >= self.MIN_PROCESS_SECONDS
+            backend = "process" if use_processes else "thread"
+        
+        if backend == "process":
+            results = self._transcribe_in_processes(
+                chunks, workers, progress_callback, chunk_callback, vad_filter, want_segments
+            )
+            return self._combine_results(results, chunk_duration, overlap, progress_callback)
+        
+        if self.model is None:
+            self.load_model(progress_callback)
+        
+        if progress_callback:
+            progress_callback(f"Transcribing {len(chunks)} chunks [{workers} workers]...")
+        
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        progress_lock = threading.Lock()
+        completed_count = [0]  # Use list for mutable reference in closure
+        report = count_reporter(progress_callback)
+        
+        def process_chunk(chunk):
+            try:
+                result = self.transcribe_chunk(chunk, vad_filter=vad_filter, want_segments=want_segments)
+            except Exception as e:
+                result = {"text": "", "segments": [], "error": str(e)}
+            # Only the count is taken under the lock; the callback runs outside it
+            with progress_lock:
+                completed_count[0] += 1
+                done = completed_count[0]
+            if report:
+                report(done, len(chunks))
+            return result
+        
+        def iter_results():
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(process_chunk, chunk): idx for idx, (chunk, _) in enumerate(chunks)}
+                
+                # Chunks finish out of order; hold early ones until every
+                # chunk before them is done, then release the run in order
+                finished = {}
+                next_idx = 0
+                for future in as_completed(futures):
+                    finished[futures[future]] = future.result()
+                    while next_idx in finished:
+                        result = finished.pop(next_idx)
+                        result["offset"] = chunks[next_idx][1]
+                        if chunk_callback:
+                            chunk_callback(self._offset_segments(result))
+                        yield result
+                        next_idx += 1
+        
+        return self._combine_results(iter_results(), chunk_duration, overlap, progress_callback)
+    
+    def _transcribe_in_processes(self, chunks: list, workers: int, progress_callback,
+                                 chunk_callback, vad_filter: bool, want_segments: bool):
+        """Run transcribe_parallel's chunks on a spawned process pool, yielding results in order."""
+        import numpy as np
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import get_context, shared_memory
+        
+        if progress_callback:
+            progress_callback(f"Transcribing {len(chunks)} chunks [{workers} processes]...")
+        report = count_reporter(progress_callback)
+        
+        # Pack every in-memory chunk into one shared block; workers get
+        # (block name, start, end) and read a zero-copy view of it
+        arrays = [chunk for chunk, _ in chunks if isinstance(chunk, np.ndarray)]
+        total = sum(len(chunk) for chunk in arrays)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, total * 4))
+        
+        try:
+            shared = np.ndarray((total,), dtype=np.float32, buffer=shm.buf)
+            jobs = []
+            pos = 0
+            for chunk, _ in chunks:
+                if isinstance(chunk, np.ndarray):
+                    shared[pos:pos + len(chunk)] = chunk
+                    jobs.append((shm.name, pos, pos + len(chunk)))
+                    pos += len(chunk)
+                else:
+                    jobs.append(chunk)  # File path
+            del shared
+            
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=get_context("spawn"),
+                initializer=_init_process_worker,
+                initargs=(self.model_size, self.compute_type, max(1, self.available_cores // workers))
+            ) as executor:
+                results = executor.map(
+                    _transcribe_in_process, jobs,
+                    itertools.repeat(vad_filter), itertools.repeat(want_segments)
+                )
+                for idx, (result, (_, offset)) in enumerate(zip(results, chunks)):
+                    result["offset"] = offset
+                    if report:
+                        report(idx + 1, len(chunks))
+                    if chunk_callback:
+                        chunk_callback(self._offset_segments(result))
+                    yield result
+        finally:
+            shm.close()
+            shm.unlink()
     
-    def transcribe_parallel(self, chunk_files: list, progress_callback=None) -> dict:
+    def transcribe_batched(self, chunks, batch_size: int = MAX_BATCH_SIZE,
+                           progress_callback=None, chunk_duration: float = 30.0,
+                           overlap: float = 0.0, total_chunks: int = None,
+                           chunk_callback=None) -> dict:
         """
-        Transcribe audio chunks with adaptive processing strategy.
+        Transcribe audio chunks with batched CTranslate2 inference.
+        
+        Bypasses the per-file transcribe() generator: the log-mel features of
+        up to `batch_size` 30s windows are stacked into one array and run
+        through a single encode + generate call, so the model weights are
+        streamed once per batch instead of once per chunk and no Python
+        threads compete for the model. Each 30s window becomes one segment.
         
-        Automatically chooses between:
-        - Sequential: When CPU is already heavily utilized (>70%)
-        - Parallel: When CPU has headroom, uses configured workers
+        Chunks are pulled lazily, so `chunks` may be a generator or
+        queue-backed iterator that is still being filled by the decoder.
         
         Args:
-            chunk_files: List of paths to audio chunk files
+            chunks: List or iterable of 16kHz float32 sample arrays (or
+                    audio chunk file paths), optionally as
+                    (chunk, start_seconds) tuples
+            batch_size: Number of 30s windows per inference call
             progress_callback: Optional callback for progress updates
+            chunk_duration: Start spacing assumed for bare chunks without a
+                            start offset (default: 30)
+            overlap: Seconds each chunk runs into the next one (default: 0)
+            total_chunks: Expected chunk count for progress; required when
+                          chunks has no len()
+            chunk_callback: Optional callback receiving each finished chunk's
+                            segments (absolute timestamps), in chunk order
             
         Returns:
             Dictionary with combined text and segments
@@ -173,78 +550,223 @@ class FastTranscriber:
         if self.model is None:
             self.load_model(progress_callback)
         
-        # Check CPU utilization to decide processing strategy
-        use_parallel = self._should_use_parallel() and self.num_workers > 1
+        import numpy as np
+        import ctranslate2
+        from faster_whisper.audio import decode_audio
+        from faster_whisper.tokenizer import Tokenizer
+        
+        extractor = self.model.feature_extractor
+        sampling_rate = extractor.sampling_rate
+        window_samples = extractor.n_samples  # 30s, the encoder's fixed input
+        
+        if total_chunks is None:
+            total_chunks = len(chunks)
         
         if progress_callback:
-            mode = f"parallel ({self.num_workers} workers)" if use_parallel else "sequential (CPU optimized)"
-            progress_callback(f"Transcribing {len(chunk_files)} chunks [{mode}]...")
+            progress_callback(
+                f"Transcribing {total_chunks} chunks [batched, up to {batch_size} windows per call]..."
+            )
         
-        all_results = []
+        report = count_reporter(progress_callback)
         
-        if use_parallel:
-            # Parallel processing with ThreadPoolExecutor
-            # Create a lock for thread-safe progress updates
-            progress_lock = threading.Lock()
-            completed_count = [0]  # Use list for mutable reference in closure
-            
-            def process_chunk(chunk_path):
-                result = self.transcribe_chunk(chunk_path)
-                with progress_lock:
-                    completed_count[0] += 1
-                    if progress_callback:
-                        progress_callback(f"Transcribed {completed_count[0]}/{len(chunk_files)} chunks...")
-                return result
+        # Results of chunks whose windows are still being transcribed
+        pending = {}
+        
+        def iter_windows():
+            # Decode lazily so only one batch of audio is held in memory.
+            # Yields (chunk index, start sample, window length, last window?, log-mel)
+            for idx, chunk in enumerate(chunks):
+                chunk, offset = self._split_chunk(chunk, idx, chunk_duration)
+                pending[idx] = {"text": "", "segments": [], "language": None, "offset": offset}
+                if isinstance(chunk, np.ndarray):
+                    audio = chunk
+                else:
+                    audio = read_wav(chunk)
+                    if audio is None:
+                        audio = decode_audio(chunk, sampling_rate=sampling_rate)
+                starts = range(0, max(len(audio), 1), window_samples)
+                for n, start in enumerate(starts):
+                    length = min(window_samples, len(audio) - start)
+                    features = self._window_features(audio[start:start + window_samples], window_samples)
+                    yield idx, start, length, n == len(starts) - 1, features
+        
+        tokenizers = {}
+        windows = iter_windows()
+        
+        def iter_results():
+            chunks_done = 0
+            chunks_emitted = 0
             
-            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-                # Submit all tasks and collect results in order
-                futures = [executor.submit(process_chunk, chunk) for chunk in chunk_files]
+            while True:
+                batch = list(itertools.islice(windows, batch_size))
+                if not batch:
+                    break
                 
-                for future in futures:
-                    try:
-                        result = future.result()
-                        all_results.append(result)
-                    except Exception as e:
-                        all_results.append({"text": "", "segments": [], "error": str(e)})
-        else:
-            # Sequential processing - faster when CPU is already fully utilized
-            for idx, chunk in enumerate(chunk_files):
-                if progress_callback:
-                    progress_callback(f"Transcribed {idx}/{len(chunk_files)} chunks...")
+                features = np.stack([window[4] for window in batch])
+                encoder_output = self.model.model.encode(
+                    ctranslate2.StorageView.from_array(np.ascontiguousarray(features)),
+                    to_cpu=False
+                )
+                
+                languages = self._detect_languages(encoder_output, len(batch))
+                prompts = []
+                for language in languages:
+                    if language not in tokenizers:
+                        tokenizers[language] = Tokenizer(
+                            self.model.hf_tokenizer,
+                            self.model.model.is_multilingual,
+                            task="transcribe",
+                            language=language
+                        )
+                    tokenizer = tokenizers[language]
+                    prompts.append(list(tokenizer.sot_sequence) + [tokenizer.no_timestamps])
+                
+                outputs = self.model.model.generate(
+                    encoder_output,
+                    prompts,
+                    beam_size=1,                 # Greedy decoding
+                    max_length=448,
+                    suppress_blank=True,
+                    suppress_tokens=[-1],
+                    return_no_speech_prob=True
+                )
+                
+                for (idx, start, length, last, _), language, output in zip(batch, languages, outputs):
+                    if last:
+                        chunks_done = idx + 1
+                    if output.no_speech_prob > self.NO_SPEECH_THRESHOLD:
+                        continue
+                    
+                    text = tokenizers[language].decode(output.sequences_ids[0]).strip()
+                    if not text:
+                        continue
+                    
+                    result = pending[idx]
+                    result["segments"].append({
+                        "start": start / sampling_rate,
+                        "end": (start + length) / sampling_rate,
+                        "text": text
+                    })
+                    result["language"] = result["language"] or language
+                
+                # Hand finished chunks on in order as soon as their last window is done
+                for idx in range(chunks_emitted, chunks_done):
+                    result = pending.pop(idx)
+                    result["text"] = " ".join(seg["text"] for seg in result["segments"])
+                    if chunk_callback:
+                        chunk_callback(self._offset_segments(result))
+                    yield result
+                chunks_emitted = chunks_done
                 
-                try:
-                    result = self.transcribe_chunk(chunk)
-                    all_results.append(result)
-                except Exception as e:
-                    all_results.append({"text": "", "segments": [], "error": str(e)})
+                if report:
+                    report(chunks_done, max(total_chunks, chunks_done))
         
-        if progress_callback:
-            progress_callback(f"Transcribed {len(chunk_files)}/{len(chunk_files)} chunks...")
+        return self._combine_results(iter_results(), chunk_duration, overlap, progress_callback)
+    
+    @staticmethod
+    def _split_chunk(chunk, idx: int, chunk_duration: float) -> tuple:
+        """Return (audio, start_seconds) for a bare chunk or a (chunk, start) tuple."""
+        if isinstance(chunk, tuple):
+            return chunk
+        return chunk, idx * chunk_duration
+    
+    @staticmethod
+    def _total_chunk_seconds(chunks: list, chunk_duration: float) -> float:
+        """Total length of (audio, offset) chunks; files count as chunk_duration."""
+        return sum(
+            chunk_duration if isinstance(chunk, (str, Path)) else len(chunk) / 16000
+            for chunk, _ in chunks
+        )
+    
+    @staticmethod
+    def _offset_segments(result: dict) -> list:
+        """Segments of one chunk result shifted to absolute timestamps."""
+        offset = result.get("offset", 0.0)
+        return [
+            {"start": seg["start"] + offset, "end": seg["end"] + offset, "text": seg["text"]}
+            for seg in result.get("segments", [])
+        ]
+    
+    def _window_features(self, samples, window_samples: int):
+        """Log-mel features of one 30s window, zero-padded to the encoder size."""
+        import numpy as np
+        
+        extractor = self.model.feature_extractor
+        if len(samples) < window_samples:
+            samples = np.pad(samples, (0, window_samples - len(samples)))
+        return extractor(samples)[:, :extractor.nb_max_frames]
+    
+    def _detect_languages(self, encoder_output, batch_len: int) -> list:
+        """Most likely language code for every window in an encoded batch."""
+        if not self.model.model.is_multilingual:
+            return ["en"] * batch_len
         
-        # Combine results in order
+        # Each entry is a list of ("<|xx|>", probability), best first
+        detections = self.model.model.detect_language(encoder_output)
+        return [detection[0][0][2:-2] for detection in detections]
+    
+    def _combine_results(self, results, chunk_duration: float, overlap: float,
+                         progress_callback=None) -> dict:
+        """
+        Combine per-chunk results, in order, into a single transcript.
+        
+        Works in one pass over `results`, which may be a generator still
+        producing chunks: each chunk is folded in as soon as the next one
+        (whose offset bounds its owned span) arrives, so the per-chunk
+        results are never held all at once.
+        
+        Args:
+            results: Per-chunk result dictionaries, in chunk order
+            chunk_duration: Start spacing assumed for results without an offset
+            overlap: Seconds each chunk runs into the next one
+            progress_callback: Optional callback for progress updates
+            
+        Returns:
+            Dictionary with combined text and segments
+        """
         combined_text = []
         combined_segments = []
+        word_count = 0
         detected_language = "unknown"
         
-        for idx, result in enumerate(all_results):
-            if result and result.get("text"):
-                combined_text.append(result["text"])
-                
-                # Adjust timestamps for chunk position
-                chunk_duration = 30.0  # Default chunk duration
-                time_offset = idx * chunk_duration
-                
-                for seg in result.get("segments", []):
-                    combined_segments.append({
-                        "start": seg["start"] + time_offset,
-                        "end": seg["end"] + time_offset,
-                        "text": seg["text"]
-                    })
-                
-                if result.get("language") and detected_language == "unknown":
-                    detected_language = result["language"]
+        def add(result, time_offset, owned):
+            nonlocal word_count, detected_language
+            if not (result and result.get("text")):
+                return
+            
+            combined_text.append(result["text"])
+            # Chunk text is single-spaced, so spaces + 1 is its word count
+            word_count += result["text"].count(" ") + 1
+            
+            for seg in result.get("segments", []):
+                # Segments starting in the overlap tail are repeated,
+                # with full context, at the head of the next chunk
+                if overlap > 0 and seg["start"] >= owned:
+                    continue
+                combined_segments.append({
+                    "start": seg["start"] + time_offset,
+                    "end": seg["end"] + time_offset,
+                    "text": seg["text"]
+                })
+            
+            if result.get("language") and detected_language == "unknown":
+                detected_language = result["language"]
+        
+        # Audio a chunk owns runs up to where the next chunk starts
+        previous = None
+        for idx, result in enumerate(results):
+            time_offset = result.get("offset", idx * chunk_duration) if result else idx * chunk_duration
+            if previous is not None:
+                add(previous[0], previous[1], time_offset - previous[1])
+            previous = (result, time_offset)
+        if previous is not None:
+            add(previous[0], previous[1], float("inf"))
         
-        full_transcript = " ".join(combined_text)
+        if overlap > 0:
+            full_transcript = merge_overlapping(combined_text, overlap_sec=overlap)
+            word_count = full_transcript.count(" ") + 1 if full_transcript else 0
+        else:
+            full_transcript = " ".join(combined_text)
         
         if progress_callback:
             progress_callback(f"Transcription complete: {len(full_transcript)} characters")
@@ -253,9 +775,35 @@ class FastTranscriber:
             "text": full_transcript,
             "segments": combined_segments,
             "language": detected_language,
-            "word_count": len(full_transcript.split())
+            "word_count": word_count
         }
     
+    def transcribe_file(self, audio_path, progress_callback=None) -> tuple:
+        """
+        Transcribe a whole audio file in one long-form call.
+        
+        faster-whisper windows the file itself (VAD-split speech, decoded in
+        batches of 30s windows where BatchedInferencePipeline is available),
+        so there are no chunk boundaries to stitch and no offsets to add.
+        
+        Args:
+            audio_path: Path to the audio file, or 16kHz float32 samples
+            progress_callback: Optional callback for progress updates
+            
+        Returns:
+            (segments, language): a lazy iterator of {"start", "end", "text"}
+            dicts with absolute timestamps, and the detected language
+        """
+        if self.model is None:
+            self.load_model(progress_callback)
+        
+        segments, info = self._start_transcription(audio_path, vad_filter=True)
+        
+        return (
+            ({"start": seg.start, "end": seg.end, "text": seg.text.strip()} for seg in segments),
+            info.language
+        )
+    
     def transcribe_single(self, audio_path: str, progress_callback=None) -> dict:
         """
         Transcribe a single audio file (non-chunked).
@@ -267,22 +815,31 @@ class FastTranscriber:
         Returns:
             Dictionary with text and segments
         """
-        if self.model is None:
-            self.load_model(progress_callback)
-        
         if progress_callback:
             progress_callback("Transcribing audio...")
         
-        result = self.transcribe_chunk(audio_path)
+        segments, language = self.transcribe_file(audio_path, progress_callback)
+        
+        segment_list = []
+        full_text = []
+        
+        for seg in segments:
+            segment_list.append(seg)
+            if seg["text"]:
+                full_text.append(seg["text"])
+            if progress_callback:
+                progress_callback(f"Transcribed {self._format_timestamp(seg['end'])} of audio...")
+        
+        text = " ".join(full_text)
         
         if progress_callback:
-            progress_callback(f"Transcription complete: {len(result['text'])} characters")
+            progress_callback(f"Transcription complete: {len(text)} characters")
         
         return {
-            "text": result["text"],
-            "segments": result["segments"],
-            "language": result.get("language", "unknown"),
-            "word_count": len(result["text"].split())
+            "text": text,
+            "segments": segment_list,
+            "language": language or "unknown",
+            "word_count": text.count(" ") + 1 if text else 0
         }
     
     def format_transcript_with_timestamps(self, result: dict) -> str:
@@ -295,20 +852,22 @@ class FastTranscriber:
         Returns:
             Formatted transcript string with timestamps
         """
-        lines = []
-        for seg in result.get("segments", []):
-            start = self._format_timestamp(seg["start"])
-            end = self._format_timestamp(seg["end"])
-            text = seg["text"]
-            lines.append(f"[{start} → {end}] {text}")
-        
-        return "\n".join(lines)
+        fmt = self._format_seconds
+        return "\n".join(
+            f"[{fmt(int(seg['start'] or 0))} → {fmt(int(seg['end'] or 0))}] {seg['text']}"
+            for seg in result.get("segments", [])
+        )
     
     def _format_timestamp(self, seconds: float) -> str:
         """Format seconds to HH:MM:SS."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        return self._format_seconds(int(seconds or 0))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _format_seconds(seconds: int) -> str:
+        """Format whole seconds to HH:MM:SS (MM:SS under an hour), memoized."""
+        hours, rem = divmod(seconds, 3600)
+        minutes, secs = divmod(rem, 60)
         
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{secs:02d}"
@@ -321,16 +880,55 @@ class FastTranscriber:
             "info": self.MODEL_INFO[self.model_size],
             "model_dir": self.model_dir,
             "num_workers": self.num_workers,
+            "device": self.device or "not loaded",
+            "compute_type": self.compute_type or "auto",
             "loaded": self.model is not None
         }
 
 
+# Model of a "process" backend worker, loaded once by _init_process_worker
+_process_transcriber = None
+
+
+def _init_process_worker(model_size: str, compute_type: str, cpu_threads: int):
+    """Load this worker process's model (ProcessPoolExecutor initializer)."""
+    global _process_transcriber
+    _process_transcriber = FastTranscriber(
+        model_size=model_size, compute_type=compute_type, cpu_threads=cpu_threads
+    )
+    _process_transcriber.load_model()
+
+
+def _transcribe_in_process(job, vad_filter: bool, want_segments: bool) -> dict:
+    """Transcribe one chunk in a worker: a file path or a (shm_name, start, end) slice."""
+    if not isinstance(job, tuple):
+        audio, shm = job, None  # File path
+    else:
+        import numpy as np
+        from multiprocessing import shared_memory
+        
+        name, start, end = job
+        shm = shared_memory.SharedMemory(name=name)
+        audio = np.frombuffer(shm.buf, dtype=np.float32, count=end - start, offset=start * 4)
+    
+    try:
+        return _process_transcriber.transcribe_chunk(
+            audio, vad_filter=vad_filter, want_segments=want_segments
+        )
+    except Exception as e:
+        return {"text": "", "segments": [], "error": str(e)}
+    finally:
+        if shm is not None:
+            del audio  # The view must go before the mapping can close
+            shm.close()
+
+
 def test_fast_transcriber():
     """Test the fast transcriber module."""
     print("Fast Transcriber Test")
     print("=" * 40)
     
-    transcriber = FastTranscriber(model_size="small", num_workers=4)
+    transcriber = FastTranscriber(model_size="small")
     info = transcriber.get_model_info()
     
     print(f"Model size: {info['model_size']}")
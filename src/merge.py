@@ -0,0 +1,125 @@
+"""
+Transcript Merge Module
+Removes words duplicated across overlapping audio chunk boundaries.
+"""
+
+import re
+
+# Shortest run of matching words accepted as a real overlap
+MIN_MATCH_WORDS = 2
+
+_NORMALIZE = re.compile(r"[^\w']+")
+
+
+def _normalize(word: str) -> str:
+    """Lowercase a word and strip punctuation so 'Hello,' matches 'hello'."""
+    return _NORMALIZE.sub("", word.lower())
+
+
+# lcs_dedup's kernel, compiled on first use (numba is slow to import)
+_kernel = None
+
+
+def lcs_dedup(a, b, min_match=MIN_MATCH_WORDS):
+    """
+    Find where to splice two overlapping runs of word ids.
+
+    Locates the longest common contiguous run between `a` (tail of the text
+    so far) and `b` (head of the next chunk) with a rolling-row DP that keeps
+    only O(len(b)) state.
+
+    Args:
+        a: int32 word ids of the preceding text
+        b: int32 word ids of the following chunk
+        min_match: Shortest run accepted as a real overlap
+
+    Returns:
+        (end_of_a, start_of_b): keep a[:end_of_a] + b[start_of_b:]
+    """
+    import numpy as np
+
+    global _kernel
+    if _kernel is None:
+        # Numba is optional - without it the kernel runs as plain Python
+        try:
+            from numba import njit
+            _kernel = njit(cache=True)(_lcs_dedup)
+        except ImportError:
+            _kernel = _lcs_dedup
+
+    # The DP rows are allocated here, so the kernel itself never needs numpy
+    prev = np.zeros(len(b) + 1, dtype=np.int32)
+    curr = np.zeros(len(b) + 1, dtype=np.int32)
+    return _kernel(a, b, min_match, prev, curr)
+
+
+def _lcs_dedup(a, b, min_match, prev, curr):
+    """Rolling-row longest-common-run DP behind lcs_dedup, over zeroed rows prev/curr."""
+    best = 0
+    best_i = 0
+    best_j = 0
+
+    for i in range(len(a)):
+        for j in range(len(b)):
+            if a[i] == b[j]:
+                curr[j + 1] = prev[j] + 1
+                if curr[j + 1] > best:
+                    best = curr[j + 1]
+                    best_i = i + 1
+                    best_j = j + 1
+            else:
+                curr[j + 1] = 0
+        prev, curr = curr, prev
+
+    if best < min_match:
+        return len(a), 0
+    return best_i, best_j
+
+
+def merge_overlapping(texts: list, overlap_sec: float = 1.0) -> str:
+    """
+    Join chunk transcripts, de-duplicating words at each chunk boundary.
+
+    Adjacent chunks share `overlap_sec` seconds of audio, so the tail of
+    chunk i and the head of chunk i+1 transcribe the same words. The longest
+    common run of words between the two is kept once; the garbled words
+    around the hard cut on either side are dropped.
+
+    Args:
+        texts: Transcript text per chunk, in order
+        overlap_sec: Audio overlap between adjacent chunks in seconds
+
+    Returns:
+        Merged transcript text
+    """
+    import numpy as np
+
+    # Only compare words that can plausibly fall inside the overlap
+    window = max(8, int(overlap_sec * 8))
+
+    vocab = {}
+    merged = []
+    merged_ids = []
+
+    for text in texts:
+        words = text.split()
+        if not words:
+            continue
+        ids = [vocab.setdefault(_normalize(w), len(vocab)) for w in words]
+
+        if merged:
+            tail = merged_ids[-window:]
+            end_of_tail, skip = lcs_dedup(
+                np.array(tail, dtype=np.int32),
+                np.array(ids[:window], dtype=np.int32)
+            )
+            cut = len(merged) - len(tail) + end_of_tail
+            del merged[cut:]
+            del merged_ids[cut:]
+            words = words[skip:]
+            ids = ids[skip:]
+
+        merged.extend(words)
+        merged_ids.extend(ids)
+
+    return " ".join(merged)
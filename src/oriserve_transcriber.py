@@ -5,9 +5,20 @@ Optimized for Indian accents and code-mixed speech.
 """
 
 import os
+import functools
+import threading
+import weakref
 from pathlib import Path
 import warnings
-import torch
+
+try:
+    from .merge import merge_overlapping
+    from .progress import count_reporter
+    from .video_processor import read_wav
+except ImportError:  # Running this file directly
+    from merge import merge_overlapping
+    from progress import count_reporter
+    from video_processor import read_wav
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -19,18 +30,59 @@ MODELS_DIR = PROJECT_ROOT / "models" / "oriserve-whisper"
 MODELS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Loaded pipelines keyed by (model id, device, dtype), shared by every
+# transcriber instance. Entries are weak, so release() lets them be freed
+_PIPE_CACHE = weakref.WeakValueDictionary()
+_PIPE_CACHE_LOCK = threading.Lock()
+
+
 class OriserveTranscriber:
     """Hindi/Hinglish transcription using Oriserve/Whisper-Hindi2Hinglish-Apex."""
     
     MODEL_ID = "Oriserve/Whisper-Hindi2Hinglish-Apex"
     
-    def __init__(self):
-        """Initialize the Oriserve transcriber."""
+    # Chunks sent through the pipeline per batched call
+    BATCH_SIZE = 8
+    
+    # Long-form windows for whole files: each 30s window overlaps its
+    # neighbours by 5s on either side, and the pipeline stitches the
+    # overlaps itself, keeping absolute timestamps
+    CHUNK_LENGTH_S = 30
+    STRIDE_LENGTH_S = 5
+    
+    # Silero speech probability above which a frame counts as speech
+    # (its default; whispered speech still clears it)
+    VAD_THRESHOLD = 0.5
+    
+    # 4-bit weight quantization (bitsandbytes NF4 on GPU, HQQ on CPU)
+    QUANT_BITS = 4
+    QUANT_GROUP_SIZE = 64
+    
+    # ONNX Runtime export with int8 weights, inside model_dir
+    ORT_DIR_NAME = "onnx-int8"
+    
+    def __init__(self, quantize: bool = True, backend: str = "torch"):
+        """
+        Initialize the Oriserve transcriber.
+        
+        Args:
+            quantize: Load 4-bit weights when the quantization backend for
+                      this device is installed (bitsandbytes on GPU, hqq on
+                      CPU); otherwise full-precision weights are used
+            backend: "torch" (default) or "ort" - run an int8 ONNX export
+                     on ONNX Runtime's CPU provider (needs optimum[onnxruntime];
+                     the export happens once, on first load)
+        """
+        if backend not in ("torch", "ort"):
+            raise ValueError(f"Invalid backend: {backend}\nAvailable: ['torch', 'ort']")
+        
+        self.quantize = quantize
+        self.backend = backend
         self.model = None
         self.processor = None
         self.pipe = None
-        self.device = "cuda:0" if torch.cuda.is_available() else "cpu"
-        self.torch_dtype = torch.float16 if torch.cuda.is_available() else torch.float32
+        self.device = None       # Resolved in load_model(), which imports torch
+        self.torch_dtype = None
         self.model_dir = str(MODELS_DIR)
     
     def load_model(self, progress_callback=None):
@@ -43,6 +95,29 @@ class OriserveTranscriber:
         if self.pipe is not None:
             return
         
+        import torch  # Deferred so constructing a transcriber stays cheap
+        
+        if self.backend == "ort":
+            self.device = "cpu"
+            self.torch_dtype = torch.float32
+        else:
+            self.device = "cuda:0" if torch.cuda.is_available() else "cpu"
+            self.torch_dtype = torch.float16 if torch.cuda.is_available() else torch.float32
+        
+        key = (self.MODEL_ID, self.backend, self.device, self.torch_dtype, self.quantize)
+        with _PIPE_CACHE_LOCK:
+            self.pipe = _PIPE_CACHE.get(key)
+            if self.pipe is None:
+                self._build_pipeline(progress_callback)
+                _PIPE_CACHE[key] = self.pipe
+            else:
+                self.model = self.pipe.model
+        
+        if progress_callback:
+            progress_callback("Oriserve model loaded successfully!")
+    
+    def _build_pipeline(self, progress_callback=None):
+        """Load the model weights and processor and wrap them in a pipeline."""
         if progress_callback:
             progress_callback(f"Loading Oriserve Hindi/Hinglish model...")
             progress_callback(f"This may take a few minutes on first run (downloading ~3GB)...")
@@ -58,14 +133,24 @@ class OriserveTranscriber:
                 progress_callback("Loading model weights...")
             
             # Load the speech-to-text model
-            self.model = AutoModelForSpeechSeq2Seq.from_pretrained(
-                self.MODEL_ID,
-                torch_dtype=self.torch_dtype,
-                low_cpu_mem_usage=True,
-                use_safetensors=True,
-                cache_dir=self.model_dir
-            )
-            self.model.to(self.device)
+            on_gpu = self.device.startswith("cuda")
+            bnb_config = None
+            if self.backend == "ort":
+                self.model = self._load_ort_model(progress_callback)
+            else:
+                bnb_config = self._bnb_config() if self.quantize and on_gpu else None
+                self.model = AutoModelForSpeechSeq2Seq.from_pretrained(
+                    self.MODEL_ID,
+                    torch_dtype=self.torch_dtype,
+                    low_cpu_mem_usage=True,
+                    use_safetensors=True,
+                    cache_dir=self.model_dir,
+                    **({"quantization_config": bnb_config, "device_map": self.device} if bnb_config else {})
+                )
+                if bnb_config is None:
+                    self.model.to(self.device)
+                if self.quantize and not on_gpu:
+                    self._quantize_hqq()
             
             if progress_callback:
                 progress_callback("Loading processor...")
@@ -80,35 +165,172 @@ class OriserveTranscriber:
                 progress_callback("Creating transcription pipeline...")
             
             # Create speech recognition pipeline
-            self.pipe = pipeline(
-                "automatic-speech-recognition",
-                model=self.model,
-                tokenizer=self.processor.tokenizer,
-                feature_extractor=self.processor.feature_extractor,
-                torch_dtype=self.torch_dtype,
-                device=self.device,
-                generate_kwargs={
-                    "task": "transcribe",
-                    "language": "en"  # Outputs Hinglish (Roman script)
-                }
-            )
+            dispatched = bnb_config is not None or hasattr(self.model, "hf_device_map")
+            self.pipe = pipeline("automatic-speech-recognition", **self._pipeline_kwargs(dispatched))
+            
+            if on_gpu and self.backend == "torch":
+                self._compile_decoder(progress_callback)
             
-            if progress_callback:
-                progress_callback("Oriserve model loaded successfully!")
-                
         except ImportError as e:
+            extra = " optimum[onnxruntime]" if self.backend == "ort" else ""
             raise ImportError(
                 f"Required packages not installed.\n"
-                f"Install with: pip install transformers torch safetensors\n"
+                f"Install with: pip install transformers torch safetensors{extra}\n"
                 f"Error: {e}"
             )
     
-    def transcribe_chunk(self, chunk_path: str) -> dict:
+    def _pipeline_kwargs(self, dispatched: bool) -> dict:
+        """
+        Keyword arguments for the speech recognition pipeline around self.model.
+        
+        A model dispatched by accelerate (bitsandbytes weights load with a
+        device_map) is already placed; transformers raises ValueError if
+        the pipeline is given a device for it too.
+        """
+        kwargs = dict(
+            model=self.model,
+            tokenizer=self.processor.tokenizer,
+            feature_extractor=self.processor.feature_extractor,
+            torch_dtype=self.torch_dtype,
+            generate_kwargs={
+                "task": "transcribe",
+                "language": "en",  # Outputs Hinglish (Roman script)
+                "num_beams": 1,    # Greedy decoding
+                "do_sample": False
+            }
+        )
+        if not dispatched:
+            kwargs["device"] = self.device
+        return kwargs
+    
+    def _load_ort_model(self, progress_callback=None):
+        """
+        Load the int8 ONNX Runtime model, exporting and quantizing it first
+        if this is the first run.
+        
+        Each exported graph (encoder, decoder, decoder-with-past) gets
+        dynamic per-channel int8 weight quantization.
+        """
+        import platform
+        import shutil
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        
+        ort_dir = Path(self.model_dir) / self.ORT_DIR_NAME
+        
+        if not (ort_dir / "config.json").exists():
+            if progress_callback:
+                progress_callback("Exporting model to ONNX (one-time, several minutes)...")
+            
+            export_dir = Path(self.model_dir) / "onnx"
+            exported = ORTModelForSpeechSeq2Seq.from_pretrained(
+                self.MODEL_ID, export=True, cache_dir=self.model_dir
+            )
+            exported.save_pretrained(export_dir)
+            del exported
+            
+            if progress_callback:
+                progress_callback("Quantizing ONNX weights to int8...")
+            
+            if platform.machine().lower() in ("arm64", "aarch64"):
+                qconfig = AutoQuantizationConfig.arm64(is_static=False, per_channel=True)
+            else:
+                qconfig = AutoQuantizationConfig.avx2(is_static=False, per_channel=True)
+            
+            for onnx_file in export_dir.glob("*.onnx"):
+                quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=onnx_file.name)
+                quantizer.quantize(save_dir=ort_dir, quantization_config=qconfig)
+            
+            for config_file in export_dir.glob("*.json"):
+                shutil.copy2(config_file, ort_dir / config_file.name)
+            shutil.rmtree(export_dir, ignore_errors=True)
+        
+        # Point each decoder role at its quantized graph, where exported
+        file_names = {}
+        for role, arg in (("encoder_model", "encoder_file_name"),
+                          ("decoder_model", "decoder_file_name"),
+                          ("decoder_with_past_model", "decoder_with_past_file_name")):
+            if (ort_dir / f"{role}_quantized.onnx").exists():
+                file_names[arg] = f"{role}_quantized.onnx"
+        
+        return ORTModelForSpeechSeq2Seq.from_pretrained(
+            ort_dir, provider="CPUExecutionProvider", **file_names
+        )
+    
+    def _bnb_config(self):
+        """NF4 quantization config for from_pretrained, or None without bitsandbytes."""
+        import importlib.util
+        import torch
+        from transformers import BitsAndBytesConfig
+        
+        if importlib.util.find_spec("bitsandbytes") is None:
+            return None
+        return BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_compute_dtype=torch.float16,
+            bnb_4bit_quant_type="nf4"
+        )
+    
+    def _quantize_hqq(self):
+        """Quantize the loaded model's linear layers in place with HQQ, if installed."""
+        try:
+            from hqq.core.quantize import BaseQuantizeConfig
+            from hqq.models.hf.base import AutoHQQHFModel
+        except ImportError:
+            return
+        
+        AutoHQQHFModel.quantize_model(
+            self.model,
+            quant_config=BaseQuantizeConfig(nbits=self.QUANT_BITS, group_size=self.QUANT_GROUP_SIZE),
+            compute_dtype=self.torch_dtype,
+            device=self.device
+        )
+    
+    def _compile_decoder(self, progress_callback=None):
+        """
+        Compile the model with a static KV cache for faster GPU decoding.
+        
+        A static cache keeps every decoder step the same shape, so
+        torch.compile can capture it as a CUDA graph instead of paying
+        Python dispatch per token. Compilation happens on a warm-up pass
+        over 30s of silence. Any failure (old torch/transformers, no
+        Triton) leaves the eager model in place.
+        """
+        import numpy as np
+        import torch
+        
+        if not hasattr(torch, "compile"):
+            return
+        
+        if progress_callback:
+            progress_callback("Compiling decoder (one-time warm-up)...")
+        
+        forward = self.model.forward
+        generation_config = self.model.generation_config
+        max_new_tokens = generation_config.max_new_tokens
+        try:
+            generation_config.cache_implementation = "static"
+            # Static cache length must cover a full 30s window (Whisper max 448)
+            generation_config.max_new_tokens = 440
+            self.model.forward = torch.compile(forward, mode="reduce-overhead", fullgraph=True)
+            self.pipe(np.zeros(30 * 16000, dtype=np.float32), return_timestamps=True)
+        except Exception:
+            self.model.forward = forward
+            generation_config.cache_implementation = None
+            generation_config.max_new_tokens = max_new_tokens
+    
+    def release(self):
+        """Drop this transcriber's pipeline; it is freed once no other transcriber shares it."""
+        self.pipe = None
+        self.model = None
+        self.processor = None
+    
+    def transcribe_chunk(self, chunk_path) -> dict:
         """
         Transcribe a single audio chunk.
         
         Args:
-            chunk_path: Path to the audio chunk file
+            chunk_path: Path to the audio chunk file, or 16kHz float32 samples
             
         Returns:
             Dictionary with text and segments
@@ -117,8 +339,48 @@ class OriserveTranscriber:
             self.load_model()
         
         # Run inference
-        result = self.pipe(chunk_path, return_timestamps=True)
+        result = self.pipe(self._load_audio(chunk_path), return_timestamps=True)
+        
+        return self._parse_result(result)
+    
+    def _prefilter_vad(self, chunks: list) -> list:
+        """
+        Run Silero VAD over each chunk once, before any of them is transcribed.
+        
+        Args:
+            chunks: (audio, start_seconds) tuples
+            
+        Returns:
+            Indices of the chunks that contain speech, in order. Without
+            faster-whisper's VAD (or for undecodable files) every chunk counts.
+        """
+        import numpy as np
+        
+        try:
+            from faster_whisper.vad import VadOptions, get_speech_timestamps
+        except ImportError:
+            return list(range(len(chunks)))
         
+        options = VadOptions(threshold=self.VAD_THRESHOLD)
+        voiced = []
+        for idx, (chunk, _) in enumerate(chunks):
+            audio = self._load_audio(chunk)
+            if not isinstance(audio, np.ndarray) or get_speech_timestamps(audio, vad_options=options):
+                voiced.append(idx)
+        return voiced
+    
+    @staticmethod
+    def _load_audio(chunk_path):
+        """Read a chunk WAV into memory; the pipeline decodes paths with an FFmpeg subprocess."""
+        if isinstance(chunk_path, (str, Path)):
+            audio = read_wav(chunk_path)
+            if audio is not None:
+                return audio
+        return chunk_path
+    
+    @staticmethod
+    def _parse_result(result: dict) -> dict:
+        """Turn one pipeline output into a chunk result dictionary."""
         # Extract text
         text = result.get("text", "").strip()
         
@@ -146,16 +408,28 @@ class OriserveTranscriber:
             "language": "hi-en"  # Hindi-English (Hinglish)
         }
     
-    def transcribe_parallel(self, chunk_files: list, progress_callback=None) -> dict:
+    def transcribe_parallel(self, chunk_files: list, progress_callback=None,
+                            chunk_duration: float = 30.0, overlap: float = 0.0,
+                            chunk_callback=None, vad_filter: bool = True) -> dict:
         """
-        Transcribe audio chunks sequentially (Oriserve doesn't benefit from parallel).
+        Transcribe audio chunks in batches of BATCH_SIZE pipeline calls.
         
-        Note: Unlike faster-whisper, transformers pipeline already optimizes internally,
-        so we process sequentially to avoid memory issues.
+        Every chunk pads to Whisper's fixed 30s input, so a batch runs as one
+        encoder/decoder pass. Memory grows with the batch, which is why it
+        is capped rather than sending every chunk at once.
         
         Args:
-            chunk_files: List of paths to audio chunk files
+            chunk_files: List of audio chunk file paths or 16kHz float32 arrays,
+                         optionally as (chunk, start_seconds) tuples
             progress_callback: Optional callback for progress updates
+            chunk_duration: Start spacing assumed for bare chunks without a
+                            start offset (default: 30)
+            overlap: Seconds each chunk runs into the next one (default: 0)
+            chunk_callback: Optional callback receiving each finished chunk's
+                            segments (absolute timestamps), in chunk order
+            vad_filter: Skip chunks Silero VAD finds no speech in (default:
+                        True); pass False when the chunks were cut from
+                        speech regions already
             
         Returns:
             Dictionary with combined text and segments
@@ -163,44 +437,83 @@ class OriserveTranscriber:
         if self.pipe is None:
             self.load_model(progress_callback)
         
-        if progress_callback:
-            progress_callback(f"Transcribing {len(chunk_files)} chunks (Hindi/Hinglish mode)...")
-        
-        all_results = []
-        
-        for idx, chunk in enumerate(chunk_files):
-            if progress_callback:
-                progress_callback(f"Transcribed {idx}/{len(chunk_files)} chunks...")
-            
-            try:
-                result = self.transcribe_chunk(chunk)
-                all_results.append(result)
-            except Exception as e:
-                all_results.append({"text": "", "segments": [], "error": str(e)})
+        chunks = [self._split_chunk(chunk, idx, chunk_duration) for idx, chunk in enumerate(chunk_files)]
+        chunk_files = [audio for audio, _ in chunks]
         
         if progress_callback:
-            progress_callback(f"Transcribed {len(chunk_files)}/{len(chunk_files)} chunks...")
+            progress_callback(f"Transcribing {len(chunk_files)} chunks (Hindi/Hinglish mode)...")
         
-        # Combine results in order
         combined_text = []
         combined_segments = []
+        word_count = 0
         
-        for idx, result in enumerate(all_results):
-            if result and result.get("text"):
-                combined_text.append(result["text"])
+        # Silent chunks never reach the model, which would only hallucinate on them
+        if vad_filter:
+            voiced = self._prefilter_vad(chunks)
+            if progress_callback and len(voiced) < len(chunks):
+                progress_callback(f"Skipping {len(chunks) - len(voiced)} silent chunks...")
+        else:
+            voiced = list(range(len(chunks)))
+        
+        report = count_reporter(progress_callback)
+        results = {}  # Voiced chunk index -> result, until folded in
+        folded = 0
+        
+        for first in range(0, len(voiced), self.BATCH_SIZE):
+            batch = voiced[first:first + self.BATCH_SIZE]
+            
+            try:
+                outputs = self.pipe(
+                    [self._load_audio(chunks[idx][0]) for idx in batch],
+                    batch_size=len(batch),
+                    return_timestamps=True
+                )
+                for idx, output in zip(batch, outputs):
+                    results[idx] = self._parse_result(output)
+            except Exception:
+                # Retry one by one so a single bad chunk doesn't sink the batch
+                for idx in batch:
+                    try:
+                        results[idx] = self.transcribe_chunk(chunks[idx][0])
+                    except Exception as e:
+                        results[idx] = {"text": "", "segments": [], "error": str(e)}
+            
+            # Silent chunks up to this batch's last one fold in as empty results
+            done = batch[-1] + 1 if first + len(batch) < len(voiced) else len(chunks)
+            
+            # Fold each result straight into the transcript, in chunk order
+            for idx in range(folded, done):
+                result = results.pop(idx, {"text": "", "segments": []})
+                time_offset = chunks[idx][1]
+                segments = [
+                    {"start": seg["start"] + time_offset, "end": seg["end"] + time_offset, "text": seg["text"]}
+                    for seg in result.get("segments", [])
+                ]
+                if chunk_callback:
+                    chunk_callback(segments)
                 
-                # Adjust timestamps for chunk position
-                chunk_duration = 30.0  # Default chunk duration
-                time_offset = idx * chunk_duration
+                if not result.get("text"):
+                    continue
+                combined_text.append(result["text"])
+                # Chunk text is single-spaced, so spaces + 1 is its word count
+                word_count += result["text"].count(" ") + 1
                 
-                for seg in result.get("segments", []):
-                    combined_segments.append({
-                        "start": seg["start"] + time_offset,
-                        "end": seg["end"] + time_offset,
-                        "text": seg["text"]
-                    })
+                # Segments starting in the overlap tail are repeated, with
+                # full context, at the head of the next chunk
+                if overlap > 0 and idx + 1 < len(chunks):
+                    owned_end = chunks[idx + 1][1]
+                    segments = [seg for seg in segments if seg["start"] < owned_end]
+                combined_segments.extend(segments)
+            folded = done
+            
+            if report:
+                report(done, len(chunk_files))
         
-        full_transcript = " ".join(combined_text)
+        if overlap > 0:
+            full_transcript = merge_overlapping(combined_text, overlap_sec=overlap)
+            word_count = full_transcript.count(" ") + 1 if full_transcript else 0
+        else:
+            full_transcript = " ".join(combined_text)
         
         if progress_callback:
             progress_callback(f"Transcription complete: {len(full_transcript)} characters")
@@ -209,13 +522,24 @@ class OriserveTranscriber:
             "text": full_transcript,
             "segments": combined_segments,
             "language": "hi-en",
-            "word_count": len(full_transcript.split())
+            "word_count": word_count
         }
     
+    @staticmethod
+    def _split_chunk(chunk, idx: int, chunk_duration: float) -> tuple:
+        """Return (audio, start_seconds) for a bare chunk or a (chunk, start) tuple."""
+        if isinstance(chunk, tuple):
+            return chunk
+        return chunk, idx * chunk_duration
+    
     def transcribe_single(self, audio_path: str, progress_callback=None) -> dict:
         """
         Transcribe a single audio file (non-chunked).
         
+        Files longer than one window are cut into overlapping strided
+        windows inside the pipeline, so boundary words are decoded with
+        context on both sides and the windows run as batches.
+        
         Args:
             audio_path: Path to the audio file
             progress_callback: Optional callback for progress updates
@@ -229,7 +553,13 @@ class OriserveTranscriber:
         if progress_callback:
             progress_callback("Transcribing audio (Hindi/Hinglish mode)...")
         
-        result = self.transcribe_chunk(audio_path)
+        result = self._parse_result(self.pipe(
+            self._load_audio(audio_path),
+            chunk_length_s=self.CHUNK_LENGTH_S,
+            stride_length_s=self.STRIDE_LENGTH_S,
+            batch_size=self.BATCH_SIZE,
+            return_timestamps=True
+        ))
         
         if progress_callback:
             progress_callback(f"Transcription complete: {len(result['text'])} characters")
@@ -238,7 +568,7 @@ class OriserveTranscriber:
             "text": result["text"],
             "segments": result["segments"],
             "language": "hi-en",
-            "word_count": len(result["text"].split())
+            "word_count": result["text"].count(" ") + 1 if result["text"] else 0
         }
     
     def format_transcript_with_timestamps(self, result: dict) -> str:
@@ -251,22 +581,22 @@ class OriserveTranscriber:
         Returns:
             Formatted transcript string with timestamps
         """
-        lines = []
-        for seg in result.get("segments", []):
-            start = self._format_timestamp(seg["start"])
-            end = self._format_timestamp(seg["end"])
-            text = seg["text"]
-            lines.append(f"[{start} → {end}] {text}")
-        
-        return "\n".join(lines)
+        fmt = self._format_seconds
+        return "\n".join(
+            f"[{fmt(int(seg['start'] or 0))} → {fmt(int(seg['end'] or 0))}] {seg['text']}"
+            for seg in result.get("segments", [])
+        )
     
     def _format_timestamp(self, seconds: float) -> str:
         """Format seconds to HH:MM:SS."""
-        if seconds is None:
-            seconds = 0
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        return self._format_seconds(int(seconds or 0))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _format_seconds(seconds: int) -> str:
+        """Format whole seconds to HH:MM:SS (MM:SS under an hour), memoized."""
+        hours, rem = divmod(seconds, 3600)
+        minutes, secs = divmod(rem, 60)
         
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{secs:02d}"
@@ -276,8 +606,9 @@ class OriserveTranscriber:
         """Get information about the current model."""
         return {
             "model_id": self.MODEL_ID,
-            "device": self.device,
-            "dtype": str(self.torch_dtype),
+            "device": self.device or "not loaded",
+            "dtype": str(self.torch_dtype) if self.torch_dtype is not None else "not loaded",
+            "backend": self.backend,
             "model_dir": self.model_dir,
             "loaded": self.pipe is not None,
             "features": ["Hindi", "Hinglish", "Indian English", "Noise Robust"]
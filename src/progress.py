@@ -0,0 +1,48 @@
+"""
+Progress Reporting Module
+Adapts progress callbacks to structured (done, total, stage) counts.
+"""
+
+import inspect
+
+
+def _accepts_counts(progress_callback) -> bool:
+    """True if the callback takes (done, total, stage) rather than one message."""
+    try:
+        params = inspect.signature(progress_callback).parameters.values()
+    except (TypeError, ValueError):
+        return False  # Builtins without a signature take a single message
+    
+    # Only named parameters count, so print-like *args callbacks get messages
+    positional = sum(
+        param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD) for param in params
+    )
+    return positional >= 3
+
+
+def count_reporter(progress_callback, stage: str = "transcribe"):
+    """
+    Wrap a progress callback for per-chunk counts.
+    
+    Callbacks taking three positional arguments get the raw counts as
+    progress_callback(done, total, stage) and format them only if they
+    render them. One-argument callbacks keep receiving the
+    "Transcribed done/total chunks..." message.
+    
+    Args:
+        progress_callback: Callback to wrap, or None
+        stage: Pipeline stage passed to structured callbacks
+    
+    Returns:
+        report(done, total), or None when there is no callback
+    """
+    if progress_callback is None:
+        return None
+    
+    if _accepts_counts(progress_callback):
+        def report(done: int, total: int):
+            progress_callback(done, total, stage)
+    else:
+        def report(done: int, total: int):
+            progress_callback(f"Transcribed {done}/{total} chunks...")
+    return report
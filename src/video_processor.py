@@ -4,16 +4,144 @@ Extracts audio from video files using FFmpeg.
 """
 
 import subprocess
+import collections
+import json
+import math
 import shutil
+import tempfile
+import time
+import wave
+from functools import lru_cache
 from pathlib import Path
 import os
 
+# Decode the first audio track to raw 16kHz mono s16le on stdout
+PCM_OUTPUT_ARGS = (
+    "-vn",                         # No video
+    "-f", "s16le",                # Raw PCM 16-bit, no container
+    "-acodec", "pcm_s16le",
+    "-ar", "16000",               # 16kHz sample rate (optimal for Whisper)
+    "-ac", "1",                   # Mono channel
+    "pipe:1"
+)
+
+# Container and stream metadata, as one JSON document
+PROBE_ARGS = (
+    "-v", "error",
+    "-show_format",
+    "-show_streams",
+    "-of", "json"
+)
+
+
+@lru_cache(maxsize=None)
+def find_ffmpeg() -> str:
+    """Find the FFmpeg executable once per process."""
+    # Check if ffmpeg is in PATH
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        return ffmpeg
+    
+    # Common Windows locations
+    common_paths = [
+        r"C:\ffmpeg\bin\ffmpeg.exe",
+        r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
+        r"C:\Program Files (x86)\ffmpeg\bin\ffmpeg.exe",
+    ]
+    
+    for path in common_paths:
+        if Path(path).exists():
+            return path
+    
+    return None
+
+
+@lru_cache(maxsize=None)
+def find_ffprobe(ffmpeg_path: str) -> str:
+    """ffprobe ships next to ffmpeg; prefer that copy, then PATH."""
+    ffmpeg = Path(ffmpeg_path)
+    sibling = ffmpeg.with_name(ffmpeg.name.replace("ffmpeg", "ffprobe"))
+    if sibling.exists():
+        return str(sibling)
+    return shutil.which("ffprobe") or str(sibling)
+
+
+@lru_cache(maxsize=32)
+def _probe_media(ffprobe_path: str, media_path: str, mtime_ns: int) -> dict:
+    """Run ffprobe once per file version; mtime_ns is only part of the cache key."""
+    result = subprocess.run(
+        [ffprobe_path, *PROBE_ARGS, media_path],
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+    return json.loads(result.stdout)
+
+
+@lru_cache(maxsize=None)
+def ffmpeg_version(ffmpeg_path: str) -> str:
+    """First line of `ffmpeg -version`, run once per executable per process."""
+    result = subprocess.run(
+        [ffmpeg_path, "-version"],
+        capture_output=True,
+        text=True,
+        timeout=10
+    )
+    return result.stdout.split('\n')[0]
+
+
+def read_wav(path):
+    """
+    Load a 16kHz mono 16-bit WAV (as written by chunk_audio) into memory.
+    
+    Lets the transcribers take samples directly instead of having each
+    chunk file decoded again by PyAV or an FFmpeg subprocess.
+    
+    Args:
+        path: Path to the WAV file
+        
+    Returns:
+        float32 numpy array in [-1, 1], or None if the file is not a WAV
+        in that exact format (the caller should pass the path through)
+    """
+    import numpy as np
+    
+    if Path(path).suffix.lower() != ".wav":
+        return None
+    try:
+        with wave.open(str(path), "rb") as src:
+            if (src.getframerate(), src.getnchannels(), src.getsampwidth()) != (16000, 1, 2):
+                return None
+            pcm = src.readframes(src.getnframes())
+    except (wave.Error, EOFError):
+        return None
+    
+    return np.multiply(np.frombuffer(pcm, dtype="<i2"), np.float32(1.0 / 32768.0), dtype=np.float32)
+
 
 class VideoProcessor:
     """Extracts audio from video files using FFmpeg."""
     
     SUPPORTED_FORMATS = {'.mp4', '.avi', '.mkv', '.mov', '.webm', '.flv', '.wmv', '.m4v'}
     
+    # Seconds of audio shared by adjacent chunks so boundary words aren't cut
+    CHUNK_OVERLAP = 1.0
+    
+    # Whisper encodes audio in fixed windows of this many seconds
+    WINDOW_SECONDS = 30.0
+    
+    # Whisper's native input rate
+    SAMPLE_RATE = 16000
+    
+    # Decoded float32 waveform backing load_audio(), inside temp_dir
+    RAW_AUDIO_NAME = "audio_f32.raw"
+    
+    # load_audio() splits inputs into time ranges of about this many
+    # seconds and decodes up to one range per core at once...
+    DECODE_SEGMENT_SECONDS = 300
+    # ...but never more than this many, as every range reads the same file
+    MAX_DECODE_WORKERS = 8
+    
     def __init__(self, temp_dir: str = None):
         """
         Initialize the video processor.
@@ -25,28 +153,9 @@ class VideoProcessor:
         self.temp_dir = Path(temp_dir) if temp_dir else project_root / "temp"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
         
-        # Find FFmpeg
-        self.ffmpeg_path = self._find_ffmpeg()
-    
-    def _find_ffmpeg(self) -> str:
-        """Find FFmpeg executable."""
-        # Check if ffmpeg is in PATH
-        ffmpeg = shutil.which("ffmpeg")
-        if ffmpeg:
-            return ffmpeg
-        
-        # Common Windows locations
-        common_paths = [
-            r"C:\ffmpeg\bin\ffmpeg.exe",
-            r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
-            r"C:\Program Files (x86)\ffmpeg\bin\ffmpeg.exe",
-        ]
-        
-        for path in common_paths:
-            if Path(path).exists():
-                return path
-        
-        return None
+        # Find FFmpeg and ffprobe (looked up once per process)
+        self.ffmpeg_path = find_ffmpeg()
+        self.ffprobe_path = find_ffprobe(self.ffmpeg_path) if self.ffmpeg_path else None
     
     def is_ffmpeg_available(self) -> bool:
         """Check if FFmpeg is available."""
@@ -58,14 +167,7 @@ class VideoProcessor:
             return "FFmpeg not found"
         
         try:
-            result = subprocess.run(
-                [self.ffmpeg_path, "-version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            first_line = result.stdout.split('\n')[0]
-            return first_line
+            return ffmpeg_version(self.ffmpeg_path)
         except Exception as e:
             return f"Error: {e}"
     
@@ -74,19 +176,25 @@ class VideoProcessor:
         ext = Path(video_path).suffix.lower()
         return ext in self.SUPPORTED_FORMATS
     
-    def extract_audio(self, video_path: str, progress_callback=None) -> str:
+    def extract_audio(self, video_path: str, progress_callback=None, cancel_event=None) -> str:
         """
         Extract audio from video file.
         
+        FFmpeg's -progress stream is read as it runs, so the callback gets
+        the percentage extracted so far and a set cancel_event stops
+        FFmpeg straight away.
+        
         Args:
             video_path: Path to the video file
             progress_callback: Optional callback for progress updates
+            cancel_event: Optional threading.Event; setting it kills FFmpeg
             
         Returns:
             Path to the extracted audio file (WAV format)
             
         Raises:
-            RuntimeError: If FFmpeg is not available or extraction fails
+            RuntimeError: If FFmpeg is not available, extraction fails or
+                          is cancelled
         """
         if not self.is_ffmpeg_available():
             raise RuntimeError(
@@ -115,38 +223,419 @@ class VideoProcessor:
         # FFmpeg command: extract audio, convert to 16kHz mono WAV
         cmd = [
             self.ffmpeg_path,
+            "-nostdin",
+            "-threads", "0",              # Let the decoder use every core
             "-i", str(video_path),        # Input video
             "-vn",                         # No video
             "-acodec", "pcm_s16le",       # PCM 16-bit encoding
             "-ar", "16000",               # 16kHz sample rate (optimal for Whisper)
             "-ac", "1",                   # Mono channel
             "-y",                         # Overwrite output
+            "-progress", "pipe:2",        # key=value progress lines on stderr
+            "-nostats",
             str(audio_path)
         ]
         
+        total_us = self.get_video_duration(str(video_path)) * 1_000_000
+        deadline = time.monotonic() + 600  # 10 minute timeout for long videos
+        log_tail = collections.deque(maxlen=20)  # FFmpeg's own messages, for errors
+        reported = -1
+        
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors="replace"
+        )
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout for long videos
+            # FFmpeg writes a progress block every half second while it runs
+            for line in proc.stderr:
+                key, sep, value = line.strip().partition("=")
+                if not sep or " " in key:
+                    log_tail.append(line)
+                elif key in ("out_time_us", "out_time_ms") and progress_callback and total_us > 0:
+                    # out_time_ms is in microseconds as well (an FFmpeg quirk)
+                    try:
+                        pct = min(100, int(int(value) * 100 / total_us))
+                    except ValueError:
+                        continue  # N/A before the first packet
+                    if pct > reported:
+                        reported = pct
+                        progress_callback(f"Extracting audio... {pct}%")
+                
+                if cancel_event is not None and cancel_event.is_set():
+                    raise RuntimeError("Audio extraction cancelled")
+                if time.monotonic() > deadline:
+                    raise RuntimeError("Audio extraction timed out (>10 minutes)")
+            
+            proc.wait()
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stderr.close()
+        
+        if proc.returncode != 0:
+            error_msg = "".join(log_tail)[-500:]
+            raise RuntimeError(f"FFmpeg error:\n{error_msg}")
+        
+        if not audio_path.exists():
+            raise RuntimeError("Audio extraction failed - output file not created")
+        
+        if progress_callback:
+            size_mb = audio_path.stat().st_size / (1024 * 1024)
+            progress_callback(f"Audio extracted: {size_mb:.1f} MB")
+        
+        return str(audio_path)
+    
+    def extract_audio_array(self, video_path: str) -> tuple:
+        """
+        Extract the video's audio straight into memory, without a WAV file.
+        
+        FFmpeg's raw PCM output is read from a pipe, so nothing is written
+        to disk and read back. The samples can be passed directly to the
+        transcribers' transcribe_single().
+        
+        Args:
+            video_path: Path to the video file
+            
+        Returns:
+            (samples, sample_rate): float32 numpy array of mono audio in
+            [-1, 1], and SAMPLE_RATE (16000)
+            
+        Raises:
+            RuntimeError: If FFmpeg is not available or decoding fails
+        """
+        import numpy as np
+        
+        samples = self._decode_range(video_path, 0)
+        if not len(samples):
+            raise RuntimeError("No audio decoded - does the video have an audio track?")
+        
+        return np.multiply(samples, np.float32(1.0 / 32768.0), dtype=np.float32), self.SAMPLE_RATE
+    
+    def _pcm_command(self, video_path, start: float = None, duration: float = None,
+                     threads: int = 0) -> list:
+        """
+        Validate the input and build the FFmpeg command that decodes it to PCM.
+        
+        `start` and `duration` (seconds) limit decoding to one time range;
+        by default the whole track is decoded. `threads` caps FFmpeg's
+        decoder threads (0 lets it use every core).
+        """
+        if not self.is_ffmpeg_available():
+            raise RuntimeError(
+                "FFmpeg not found! Please install FFmpeg and add it to your PATH.\n"
+                "Download from: https://ffmpeg.org/download.html"
+            )
+        
+        video_path = Path(video_path)
+        
+        if not video_path.exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+        
+        if not self.is_supported_format(str(video_path)):
+            raise ValueError(
+                f"Unsupported video format: {video_path.suffix}\n"
+                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
             )
+        
+        seek = []
+        if start:
+            seek += ["-ss", f"{start:.6f}"]
+        if duration is not None:
+            seek += ["-t", f"{duration:.6f}"]
+        
+        return [
+            self.ffmpeg_path,
+            "-nostdin",
+            "-loglevel", "error",
+            "-threads", str(threads),     # Decoder threads; 0 uses every core
+            *seek,
+            "-i", str(video_path),        # Input video
+            *PCM_OUTPUT_ARGS
+        ]
+    
+    def _decode_range(self, video_path, start: float, duration: float = None):
+        """Decode one time range of the audio track to int16 samples in memory."""
+        import numpy as np
+        
+        result = subprocess.run(
+            self._pcm_command(video_path, start, duration), capture_output=True
+        )
+        if result.returncode != 0:
+            error_msg = result.stderr.decode("utf-8", errors="replace")[-500:]
+            raise RuntimeError(f"FFmpeg error:\n{error_msg}")
+        return np.frombuffer(result.stdout, dtype=np.int16)
+    
+    def _decode_range_into(self, video_path, out, start: float, duration: float = None) -> tuple:
+        """
+        Stream one time range of the audio track into `out` as float32.
+        
+        Samples are scaled a block at a time straight off FFmpeg's pipe,
+        so a range is never held whole in memory. A range that comes up
+        short leaves the rest of `out` untouched.
+        
+        Returns:
+            (samples written to out, list of float32 blocks that didn't fit)
+        """
+        import numpy as np
+        
+        scale = np.float32(1.0 / 32768.0)
+        block = np.empty(self.SAMPLE_RATE * 10, dtype=np.int16)  # 10s of PCM per pass
+        raw = block.view(np.uint8)
+        view = memoryview(raw)
+        written = 0
+        spill = []
+        
+        # One decoder thread per process: ranges already run side by side
+        cmd = self._pcm_command(video_path, start, duration, threads=1)
+        with tempfile.TemporaryFile() as stderr:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+            filled = 0  # bytes; a read may end mid-sample
+            eof = False
             
-            if result.returncode != 0:
-                error_msg = result.stderr[-500:] if len(result.stderr) > 500 else result.stderr
+            try:
+                while not eof:
+                    while filled < len(raw):
+                        n = proc.stdout.readinto(view[filled:])
+                        if not n:
+                            eof = True
+                            break
+                        filled += n
+                    samples = filled // 2
+                    
+                    fit = min(samples, len(out) - written)
+                    np.multiply(block[:fit], scale, out=out[written:written + fit])
+                    written += fit
+                    if fit < samples:
+                        spill.append(np.multiply(block[fit:samples], scale, dtype=np.float32))
+                    
+                    # Keep any partial sample for the next pass
+                    raw[:filled - samples * 2] = raw[samples * 2:filled]
+                    filled -= samples * 2
+                
+                proc.wait()
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+            
+            if proc.returncode != 0:
+                stderr.seek(0)
+                error_msg = stderr.read().decode("utf-8", errors="replace")[-500:]
                 raise RuntimeError(f"FFmpeg error:\n{error_msg}")
+        
+        return written, spill
+    
+    def load_audio(self, video_path: str):
+        """
+        Decode the video's whole audio track into one memory-mapped waveform.
+        
+        Samples are streamed to `temp/audio_f32.raw` as they are decoded and
+        mapped back, so long recordings live in the page cache rather than
+        in process memory. Slices of the result are zero-copy views.
+        
+        Recordings longer than DECODE_SEGMENT_SECONDS are cut into time
+        ranges decoded by one FFmpeg process per core at once, each
+        streaming into its own slice of the preallocated file. Ranges join
+        to within a resampler frame.
+        
+        Args:
+            video_path: Path to the video file
             
-            if not audio_path.exists():
-                raise RuntimeError("Audio extraction failed - output file not created")
+        Returns:
+            float32 numpy memmap of 16kHz mono audio in [-1, 1]
+            (copy-on-write: in-place edits never reach the file)
             
-            if progress_callback:
-                size_mb = audio_path.stat().st_size / (1024 * 1024)
-                progress_callback(f"Audio extracted: {size_mb:.1f} MB")
+        Raises:
+            RuntimeError: If FFmpeg is not available or decoding fails
+        """
+        import numpy as np
+        from concurrent.futures import ThreadPoolExecutor
+        
+        duration = self.get_video_duration(video_path)
+        
+        # Decoding finishes before Whisper's threads get busy, so it can
+        # use every core this process may run on
+        try:
+            cores = len(os.sched_getaffinity(0))
+        except AttributeError:  # Not available on Windows/macOS
+            cores = os.cpu_count() or 1
+        workers = min(cores, self.MAX_DECODE_WORKERS, math.ceil(duration / self.DECODE_SEGMENT_SECONDS))
+        
+        raw_path = self.temp_dir / self.RAW_AUDIO_NAME
+        if workers > 1:
+            # Sample offset of each range's start, plus the probed end
+            bounds = [round(i * duration / workers * self.SAMPLE_RATE) for i in range(workers + 1)]
+            audio = np.memmap(raw_path, dtype=np.float32, mode="w+", shape=(bounds[-1],))
+            
+            def decode(i):
+                start = bounds[i] / self.SAMPLE_RATE
+                # The last range runs to the end, whatever the probed duration
+                length = (bounds[i + 1] - bounds[i]) / self.SAMPLE_RATE if i < workers - 1 else None
+                return self._decode_range_into(video_path, audio[bounds[i]:bounds[i + 1]], start, length)
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                written, spill = list(executor.map(decode, range(workers)))[-1]
+            audio.flush()
+            del audio
+            
+            # Fit the file to where the last range actually ended
+            with open(raw_path, "r+b") as f:
+                f.truncate((bounds[-2] + written) * 4)
+                f.seek(0, os.SEEK_END)
+                for block in spill:
+                    block.tofile(f)
+        else:
+            with open(raw_path, "wb") as f:
+                for chunk, _ in self.iter_audio_chunks(video_path, chunk_duration=60):
+                    chunk.tofile(f)
+        
+        return np.memmap(raw_path, dtype=np.float32, mode="c")
+    
+    def iter_audio_chunks(self, video_path: str, chunk_duration: float = 30, overlap: float = 0.0):
+        """
+        Decode the video's audio track straight into memory, chunk by chunk.
+        
+        A single FFmpeg pass writes 16kHz mono PCM to a pipe; no WAV file or
+        chunk files touch the disk. Chunks are yielded as soon as enough
+        samples have been decoded, so transcription can start right away.
+        
+        Args:
+            video_path: Path to the video file
+            chunk_duration: Duration of each chunk in seconds (default: 30)
+            overlap: Extra seconds each chunk runs into the next one (default: 0)
             
-            return str(audio_path)
+        Yields:
+            (samples, start_seconds) tuples in order, where samples is a
+            float32 numpy array of 16kHz mono audio in [-1, 1]
             
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("Audio extraction timed out (>10 minutes)")
+        Raises:
+            RuntimeError: If FFmpeg is not available or decoding fails
+        """
+        import numpy as np
+        
+        cmd = self._pcm_command(video_path)
+        
+        step = max(1, int(chunk_duration * self.SAMPLE_RATE))
+        span = step + int(overlap * self.SAMPLE_RATE)
+        overlap_samples = span - step
+        
+        with tempfile.TemporaryFile() as stderr:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+            # One window of PCM, filled in place straight from the pipe
+            buffer = np.empty(span, dtype=np.int16)
+            raw = buffer.view(np.uint8)
+            view = memoryview(raw)
+            filled = 0  # bytes; a read may end mid-sample
+            count = 0
+            eof = False
+            
+            try:
+                while True:
+                    # Fill one window (chunk plus overlap) from the pipe
+                    while not eof and filled < span * 2:
+                        n = proc.stdout.readinto(view[filled:])
+                        if not n:
+                            eof = True
+                            break
+                        filled += n
+                    samples = filled // 2
+                    
+                    # A tail shorter than the overlap is already in the previous chunk
+                    if samples == 0 or (count > 0 and samples <= overlap_samples):
+                        break
+                    
+                    yield (
+                        np.multiply(buffer[:samples], np.float32(1.0 / 32768.0), dtype=np.float32),
+                        count * step / self.SAMPLE_RATE
+                    )
+                    count += 1
+                    
+                    # Slide the overlap (and any partial sample) to the front
+                    kept = max(0, filled - step * 2)
+                    raw[:kept] = raw[step * 2:filled]
+                    filled = kept
+                    if eof and filled // 2 <= overlap_samples:
+                        break
+                
+                proc.wait()
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+            
+            if proc.returncode != 0:
+                stderr.seek(0)
+                error_msg = stderr.read().decode("utf-8", errors="replace")[-500:]
+                raise RuntimeError(f"FFmpeg error:\n{error_msg}")
+        
+        if count == 0:
+            raise RuntimeError("No audio decoded - does the video have an audio track?")
+    
+    def iter_speech_chunks(self, video_path: str, chunk_duration: float = 30,
+                           min_silence_ms: int = 500):
+        """
+        Decode the video's audio and yield only its speech, packed into chunks.
+        
+        Silero VAD (bundled with faster-whisper) finds the speech regions of
+        the whole track. Consecutive regions are packed greedily into chunks
+        of at most `chunk_duration` seconds, and the silence between chunks
+        is never sent to Whisper. Chunks are cut at pauses, so they don't
+        need to overlap.
+        
+        Args:
+            video_path: Path to the video file
+            chunk_duration: Maximum duration of each chunk in seconds (default: 30)
+            min_silence_ms: Shortest pause that separates two speech regions
+            
+        Yields:
+            (samples, start_seconds) tuples in order; samples are zero-copy
+            views into the decoded float32 audio
+        """
+        audio = self.load_audio(video_path)
+        
+        rate = self.SAMPLE_RATE
+        max_samples = max(1, int(chunk_duration * rate))
+        span_start = span_end = None
+        
+        for start, end in self.speech_regions(audio, min_silence_ms).tolist():
+            # Close the current chunk if this region doesn't fit in it
+            if span_start is not None and end - span_start > max_samples:
+                yield audio[span_start:span_end], span_start / rate
+                span_start = None
+            
+            if span_start is None:
+                span_start = start
+            span_end = end
+            
+            # A single region longer than a chunk is split at chunk length
+            while span_end - span_start > max_samples:
+                yield audio[span_start:span_start + max_samples], span_start / rate
+                span_start += max_samples
+        
+        if span_start is not None:
+            yield audio[span_start:span_end], span_start / rate
+    
+    def speech_regions(self, audio, min_silence_ms: int = 500):
+        """
+        Run Silero VAD once over a whole 16kHz waveform.
+        
+        Args:
+            audio: float32 numpy array of 16kHz mono samples
+            min_silence_ms: Shortest pause that separates two speech regions
+            
+        Returns:
+            int64 numpy array of shape (N, 2) with the [start, end) sample
+            index of each speech region, in order
+        """
+        import numpy as np
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+        
+        speech = get_speech_timestamps(
+            audio, vad_options=VadOptions(min_silence_duration_ms=min_silence_ms)
+        )
+        return np.array(
+            [(region["start"], region["end"]) for region in speech], dtype=np.int64
+        ).reshape(-1, 2)
     
     def get_video_duration(self, video_path: str) -> float:
         """
@@ -161,32 +650,35 @@ class VideoProcessor:
         if not self.is_ffmpeg_available():
             return 0.0
         
-        # Use ffprobe (comes with FFmpeg)
-        ffprobe = self.ffmpeg_path.replace("ffmpeg", "ffprobe")
-        
-        cmd = [
-            ffprobe,
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path)
-        ]
-        
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            return float(result.stdout.strip())
+            return float(self._probe(video_path)["format"]["duration"])
         except:
             return 0.0
     
+    def _probe(self, video_path: str) -> dict:
+        """
+        Format and stream metadata of a media file, from one ffprobe call.
+        
+        Results are cached per path and modification time, so duration,
+        codec and bitrate lookups on the same file share a single probe.
+        
+        Raises:
+            OSError: If the file doesn't exist
+            ValueError: If ffprobe produced no metadata
+        """
+        # Use ffprobe (comes with FFmpeg)
+        path = os.path.abspath(video_path)
+        return _probe_media(self.ffprobe_path, path, os.stat(path).st_mtime_ns)
+    
     def cleanup_temp_files(self):
         """Remove temporary audio files."""
-        for file in self.temp_dir.glob("*_audio.wav"):
-            try:
-                file.unlink()
-            except:
-                pass
+        self._unlink_entries(
+            self.temp_dir,
+            lambda name: name.endswith("_audio.wav") or name == self.RAW_AUDIO_NAME
+        )
     
-    def chunk_audio(self, audio_path: str, chunk_duration: int = 30, progress_callback=None) -> list:
+    def chunk_audio(self, audio_path: str, chunk_duration: float = 30, progress_callback=None,
+                    overlap: float = 0.0) -> list:
         """
         Split audio into chunks for parallel processing.
         
@@ -194,10 +686,39 @@ class VideoProcessor:
             audio_path: Path to the audio file
             chunk_duration: Duration of each chunk in seconds (default: 30)
             progress_callback: Optional callback for progress updates
+            overlap: Extra seconds each chunk runs into the next one (default: 0)
             
         Returns:
             List of paths to chunk files
         """
+        if progress_callback:
+            progress_callback("Splitting audio into chunks...")
+        
+        chunk_files = list(self.iter_chunks(audio_path, chunk_duration, overlap))
+        
+        if progress_callback:
+            details = f"{chunk_duration:.1f}s each"
+            if overlap > 0:
+                details += f", {overlap:g}s overlap"
+            progress_callback(f"Created {len(chunk_files)} audio chunks ({details})")
+        
+        return chunk_files
+    
+    def iter_chunks(self, audio_path: str, chunk_duration: float = 30, overlap: float = 0.0):
+        """
+        Split audio into chunks, yielding each chunk as soon as it is written.
+        
+        Lets transcription start on the first chunks while later ones are
+        still being produced.
+        
+        Args:
+            audio_path: Path to the audio file
+            chunk_duration: Duration of each chunk in seconds (default: 30)
+            overlap: Extra seconds each chunk runs into the next one (default: 0)
+            
+        Yields:
+            Paths to chunk files, in order
+        """
         if not self.is_ffmpeg_available():
             raise RuntimeError("FFmpeg not found!")
         
@@ -213,63 +734,169 @@ class VideoProcessor:
         for f in chunks_dir.glob("*.wav"):
             f.unlink()
         
-        if progress_callback:
-            progress_callback("Splitting audio into chunks...")
+        if overlap > 0:
+            chunk_iter = self._iter_overlapping_chunks(audio_path, chunks_dir, chunk_duration, overlap)
+        else:
+            chunk_iter = self._iter_segment_chunks(audio_path, chunks_dir, chunk_duration)
         
-        # FFmpeg command to segment audio
+        count = 0
+        for chunk_path in chunk_iter:
+            count += 1
+            yield chunk_path
+        
+        if count == 0:
+            raise RuntimeError("No audio chunks created")
+    
+    def _iter_segment_chunks(self, audio_path: Path, chunks_dir: Path, chunk_duration: float):
+        """Run the FFmpeg segment muxer, yielding chunks as they are finished."""
+        # FFmpeg command to segment audio in a single pass. The input is the
+        # 16kHz mono PCM WAV from extract_audio, so stream copy is enough.
         output_pattern = str(chunks_dir / "chunk_%03d.wav")
         
         cmd = [
             self.ffmpeg_path,
+            "-y",
             "-i", str(audio_path),
             "-f", "segment",
             "-segment_time", str(chunk_duration),
-            "-acodec", "pcm_s16le",
-            "-ar", "16000",
-            "-ac", "1",
-            "-y",
+            "-c", "copy",                 # No re-encode, just split the stream
+            "-reset_timestamps", "1",     # Each chunk starts at t=0
             output_pattern
         ]
         
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
+        with tempfile.TemporaryFile() as stderr:
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr)
+            # Stream copy only moves bytes; even hours of audio split in seconds
+            deadline = time.monotonic() + 60
+            emitted = 0
             
-            if result.returncode != 0:
-                error_msg = result.stderr[-500:] if len(result.stderr) > 500 else result.stderr
+            try:
+                while True:
+                    finished = proc.poll() is not None
+                    
+                    with os.scandir(chunks_dir) as entries:
+                        names = sorted(
+                            e.name for e in entries
+                            if e.name.startswith("chunk_") and e.name.endswith(".wav")
+                        )
+                    
+                    # While FFmpeg runs, the newest chunk may still be open
+                    ready = names if finished else names[:-1]
+                    for name in ready[emitted:]:
+                        suspended = time.monotonic()
+                        yield str(chunks_dir / name)
+                        # Time spent in the consumer doesn't count against FFmpeg
+                        deadline += time.monotonic() - suspended
+                    emitted = max(emitted, len(ready))
+                    
+                    if finished:
+                        break
+                    # Re-poll: FFmpeg may have finished while we were suspended
+                    if proc.poll() is None and time.monotonic() > deadline:
+                        raise RuntimeError("Audio chunking timed out")
+                    time.sleep(0.2)
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+            
+            if proc.returncode != 0:
+                stderr.seek(0)
+                error_msg = stderr.read().decode("utf-8", errors="replace")[-500:]
                 raise RuntimeError(f"FFmpeg chunking error:\n{error_msg}")
+    
+    def _iter_overlapping_chunks(self, audio_path: Path, chunks_dir: Path,
+                                 chunk_duration: float, overlap: float):
+        """
+        Cut overlapping windows straight out of the PCM WAV.
+        
+        The segment muxer can't overlap chunks, so the frames are copied
+        with the wave module instead - one read pass, no re-encode and no
+        ffmpeg process per chunk.
+        """
+        with wave.open(str(audio_path), "rb") as src:
+            params = src.getparams()
             
-            # Get sorted list of chunk files
-            chunk_files = sorted(chunks_dir.glob("chunk_*.wav"))
+            for idx, (frames, _) in enumerate(self._iter_wav_windows(src, chunk_duration, overlap)):
+                chunk_path = chunks_dir / f"chunk_{idx:03d}.wav"
+                with wave.open(str(chunk_path), "wb") as dst:
+                    dst.setparams(params)
+                    dst.writeframes(frames)
+                
+                yield str(chunk_path)
+    
+    def iter_wav_chunks(self, audio_path: str, chunk_duration: float = 30, overlap: float = 0.0):
+        """
+        Split the PCM WAV from extract_audio into in-memory chunks.
+        
+        The array counterpart of chunk_audio: frames are read straight out
+        of the WAV, with no chunk files written and no FFmpeg process.
+        
+        Args:
+            audio_path: Path to a 16kHz mono 16-bit WAV
+            chunk_duration: Duration of each chunk in seconds (default: 30)
+            overlap: Extra seconds each chunk runs into the next one (default: 0)
             
-            if not chunk_files:
-                raise RuntimeError("No audio chunks created")
+        Yields:
+            (samples, start_seconds) tuples in order, where samples is a
+            float32 numpy array in [-1, 1]
             
-            if progress_callback:
-                progress_callback(f"Created {len(chunk_files)} audio chunks ({chunk_duration}s each)")
+        Raises:
+            ValueError: If the WAV is not 16kHz mono 16-bit PCM
+        """
+        import numpy as np
+        
+        with wave.open(str(audio_path), "rb") as src:
+            if (src.getframerate(), src.getnchannels(), src.getsampwidth()) != (self.SAMPLE_RATE, 1, 2):
+                raise ValueError(f"Expected a 16kHz mono 16-bit WAV: {audio_path}")
             
-            return [str(f) for f in chunk_files]
+            for frames, start in self._iter_wav_windows(src, chunk_duration, overlap):
+                samples = np.frombuffer(frames, dtype="<i2")
+                yield (
+                    np.multiply(samples, np.float32(1.0 / 32768.0), dtype=np.float32),
+                    start / self.SAMPLE_RATE
+                )
+    
+    @staticmethod
+    def _iter_wav_windows(src, chunk_duration: float, overlap: float):
+        """Yield (frames, start_frame) for each chunk window of an open wave reader."""
+        rate = src.getframerate()
+        total_frames = src.getnframes()
+        
+        step = max(1, int(chunk_duration * rate))
+        span = step + int(overlap * rate)
+        overlap_frames = span - step
+        
+        for idx, start in enumerate(range(0, total_frames, step)):
+            # A tail shorter than the overlap is already in the previous chunk
+            if idx > 0 and total_frames - start <= overlap_frames:
+                break
             
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("Audio chunking timed out")
+            src.setpos(start)
+            yield src.readframes(min(span, total_frames - start)), start
     
     def cleanup_chunks(self):
         """Remove temporary chunk files."""
         chunks_dir = self.temp_dir / "chunks"
-        if chunks_dir.exists():
-            for file in chunks_dir.glob("*.wav"):
-                try:
-                    file.unlink()
-                except:
-                    pass
-            try:
-                chunks_dir.rmdir()
-            except:
-                pass
+        self._unlink_entries(chunks_dir, lambda name: name.endswith(".wav"))
+        try:
+            chunks_dir.rmdir()
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _unlink_entries(directory: Path, matches):
+        """Delete the files in `directory` whose names satisfy `matches`, in one scandir pass."""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if matches(entry.name):
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            pass  # Directory doesn't exist
 
 
 def test_video_processor():
@@ -0,0 +1,35 @@
+"""Tests for the Oriserve transcriber's pipeline setup (no model download needed)."""
+
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.oriserve_transcriber import OriserveTranscriber
+
+
+class PipelineKwargsTest(unittest.TestCase):
+    def setUp(self):
+        self.transcriber = OriserveTranscriber()
+        self.transcriber.model = object()
+        self.transcriber.processor = SimpleNamespace(tokenizer="tokenizer", feature_extractor="features")
+        self.transcriber.device = "cuda:0"
+        self.transcriber.torch_dtype = "float16"
+    
+    def test_placed_model_gets_device(self):
+        kwargs = self.transcriber._pipeline_kwargs(dispatched=False)
+        self.assertEqual(kwargs["device"], "cuda:0")
+        self.assertIs(kwargs["model"], self.transcriber.model)
+    
+    def test_dispatched_model_gets_no_device(self):
+        # bitsandbytes weights are placed by accelerate's device_map
+        kwargs = self.transcriber._pipeline_kwargs(dispatched=True)
+        self.assertNotIn("device", kwargs)
+        self.assertIs(kwargs["model"], self.transcriber.model)
+        self.assertEqual(kwargs["generate_kwargs"]["task"], "transcribe")
+
+
+if __name__ == "__main__":
+    unittest.main()